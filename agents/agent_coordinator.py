@@ -1,18 +1,37 @@
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple
 from dataclasses import dataclass
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque, OrderedDict
+import copy
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from enum import Enum
-from .base_agent import BaseAgent, AgentMessage
-from .web_researcher import WebResearcher
-from .verification_agent import VerificationAgent
-from .synthesizer_agent import SynthesizerAgent
-from .output_generator import OutputGenerator
+from functools import lru_cache
+import importlib
+from .base_agent import BaseAgent, AgentMessage, AgentExecutionError
 
-class AgentStatus(Enum):
-    """Enumeration for agent status."""
+# Agent name -> (module within this package, class name). Modules are imported
+# on first use so importing the coordinator doesn't pull in every agent's dependencies.
+AGENT_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "web_researcher": ("web_researcher", "WebResearcher"),
+    "verification_agent": ("verification_agent", "VerificationAgent"),
+    "synthesizer_agent": ("synthesizer_agent", "SynthesizerAgent"),
+    "output_generator": ("output_generator", "OutputGenerator"),
+}
+
+@lru_cache(maxsize=None)
+def _load_agent_class(agent_name: str) -> type:
+    """Import and return the agent class registered under agent_name."""
+    module_name, class_name = AGENT_REGISTRY[agent_name]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
+class AgentStatus(str, Enum):
+    """Enumeration for agent status. Members compare equal to their string values."""
     IDLE = "idle"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -67,52 +86,63 @@ class AgentCoordinator(BaseAgent):
         # Initialize agents
         self.agents = self._initialize_agents()
         
-        # Task management
-        self.tasks = {}
-        self.task_queue = asyncio.Queue()
-        self.running_tasks = {}
-        
         # Workflow definition
         self.workflow = self._define_workflow()
         
-        # Event tracking
-        self.events = []
+        # Resolve each step's agent once; execute_step only dereferences this
+        self._resolved_steps: Dict[str, Tuple[WorkflowStep, Optional[BaseAgent]]] = {
+            step.name: (step, self.agents.get(step.agent)) for step in self.workflow
+        }
+        
+        # Message builders per workflow step (see _prepare_agent_message)
+        self._prep_map: Dict[str, Callable[[Dict[str, Any]], AgentMessage]] = {
+            "web_research": self._prep_web,
+            "verification": self._prep_verify,
+            "synthesis": self._prep_synth,
+            "output_generation": self._prep_output
+        }
+        
+        # Event tracking (bounded so long-lived coordinators don't grow without limit)
+        self.events = deque(maxlen=self.config.get("max_events", 1024))
         self.current_workflow_id = None
         
         # Configuration
         self.max_concurrent_tasks = self.config.get("max_concurrent_tasks", 3)
         self.default_timeout = self.config.get("default_timeout", 300)
         self.retry_attempts = self.config.get("retry_attempts", 2)
+        self.retry_backoff = self.config.get("retry_backoff", 0.5)  # seconds, doubled per attempt
+        
+        # Workflow result cache: (topic, query, max_sources, format) -> (stored_at, results)
+        self.workflow_cache_size = self.config.get("workflow_cache_size", 64)
+        self.workflow_cache_ttl = self.config.get("workflow_cache_ttl", 3600)  # seconds
+        self._workflow_cache: "OrderedDict[Tuple[str, str, int, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._inflight_workflows: Dict[Tuple[str, str, int, str], asyncio.Future] = {}
+        
+        # Optional dedicated event loop (see run_in_dedicated_loop)
+        self._dedicated_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dedicated_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Concurrency limits: one global cap plus optional per-step caps,
+        # e.g. {"step_concurrency": {"web_research": 1}}
+        self._sem = asyncio.Semaphore(self.max_concurrent_tasks)
+        self._step_sem: Dict[str, asyncio.Semaphore] = {
+            step_name: asyncio.Semaphore(limit)
+            for step_name, limit in self.config.get("step_concurrency", {}).items()
+        }
     
     def _initialize_agents(self) -> Dict[str, BaseAgent]:
         """Initialize all available agents."""
         agents = {}
         
         try:
-            # Web Researcher
-            agents["web_researcher"] = WebResearcher(
-                self.config.get("web_researcher", {})
-            )
-            
-            # Verification Agent
-            agents["verification_agent"] = VerificationAgent(
-                self.config.get("verification_agent", {})
-            )
-            
-            # Synthesizer Agent
-            agents["synthesizer_agent"] = SynthesizerAgent(
-                self.config.get("synthesizer_agent", {})
-            )
+            for agent_name in AGENT_REGISTRY:
+                agent_class = _load_agent_class(agent_name)
+                agents[agent_name] = agent_class(self.config.get(agent_name, {}))
             
-            # Output Generator
-            agents["output_generator"] = OutputGenerator(
-                self.config.get("output_generator", {})
-            )
-            
-            self.logger.info(f"Initialized {len(agents)} agents")
+            self.logger.info("Initialized %d agents", len(agents))
             
         except Exception as e:
-            self.logger.error(f"Error initializing agents: {str(e)}")
+            self.logger.error("Error initializing agents: %s", e)
             
         return agents
     
@@ -179,15 +209,23 @@ class AgentCoordinator(BaseAgent):
             workflow_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             self.current_workflow_id = workflow_id
             
-            self.logger.info(f"Starting workflow {workflow_id} for topic: {topic}")
+            self.logger.info("Starting workflow %s for topic: %s", workflow_id, topic)
             
-            # Execute workflow
-            workflow_results = await self.execute_workflow(
-                topic=topic,
-                query=query,
-                max_sources=max_sources,
-                output_format=output_format
-            )
+            # Execute workflow, sharing one run between identical concurrent requests
+            cache_key = (topic.strip().lower(), query.strip().lower(), max_sources, output_format)
+            workflow_results = self._get_cached_workflow(cache_key)
+            if workflow_results is not None:
+                self.logger.info("Reusing cached results for workflow %s", workflow_id)
+            else:
+                run = self._inflight_workflows.get(cache_key)
+                if run is None:
+                    run = asyncio.ensure_future(self._run_and_cache_workflow(
+                        cache_key, topic, query, max_sources, output_format
+                    ))
+                    self._inflight_workflows[cache_key] = run
+                    run.add_done_callback(lambda _: self._inflight_workflows.pop(cache_key, None))
+                # Every waiter gets its own copy; the run's result is also the cached entry
+                workflow_results = copy.deepcopy(await asyncio.shield(run))
             
             return AgentMessage.create(
                 role="assistant",
@@ -199,12 +237,12 @@ class AgentCoordinator(BaseAgent):
                 metadata={
                     "agent": self.name,
                     "workflow_id": workflow_id,
-                    "steps_completed": len([r for r in workflow_results if r.get("status") == "completed"])
+                    "steps_completed": len([r for r in workflow_results if r.get("status") == AgentStatus.COMPLETED])
                 }
             )
             
         except Exception as e:
-            self.logger.error(f"Error in AgentCoordinator: {str(e)}", exc_info=True)
+            self.logger.error("Error in AgentCoordinator: %s", e, exc_info=True)
             return AgentMessage.create(
                 role="assistant",
                 content={
@@ -214,9 +252,48 @@ class AgentCoordinator(BaseAgent):
                 metadata={"agent": self.name}
             )
     
-    async def execute_workflow(self, topic: str, query: str, max_sources: int, output_format: str) -> List[Dict[str, Any]]:
+    async def _run_and_cache_workflow(self, cache_key: Tuple[str, str, int, str], topic: str,
+                                      query: str, max_sources: int, output_format: str) -> List[Dict[str, Any]]:
+        """Execute the workflow and cache the results if every step succeeded."""
+        results = await self.execute_workflow_collect(
+            topic=topic,
+            query=query,
+            max_sources=max_sources,
+            output_format=output_format
+        )
+        
+        if results and results[-1].get("step") == "output_generation" and results[-1].get("status") == AgentStatus.COMPLETED:
+            self._store_cached_workflow(cache_key, results)
+        
+        return results
+    
+    def _get_cached_workflow(self, cache_key: Tuple[str, str, int, str]) -> Optional[List[Dict[str, Any]]]:
+        """Return a deep copy of cached workflow results, or None on a miss or expired entry."""
+        entry = self._workflow_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.workflow_cache_ttl:
+            del self._workflow_cache[cache_key]
+            return None
+        
+        self._workflow_cache.move_to_end(cache_key)
+        return copy.deepcopy(results)
+    
+    def _store_cached_workflow(self, cache_key: Tuple[str, str, int, str], results: List[Dict[str, Any]]):
+        """Store workflow results, evicting the least recently used entry when full."""
+        if self.workflow_cache_size <= 0:
+            return
+        
+        self._workflow_cache[cache_key] = (time.monotonic(), results)
+        self._workflow_cache.move_to_end(cache_key)
+        while len(self._workflow_cache) > self.workflow_cache_size:
+            self._workflow_cache.popitem(last=False)
+    
+    async def execute_workflow(self, topic: str, query: str, max_sources: int, output_format: str) -> AsyncIterator[Dict[str, Any]]:
         """
-        Execute the complete research workflow.
+        Execute the complete research workflow, yielding each step result as it completes.
         
         Args:
             topic: Research topic
@@ -224,96 +301,136 @@ class AgentCoordinator(BaseAgent):
             max_sources: Maximum number of sources to collect
             output_format: Output format for the report
             
-        Returns:
-            List of workflow step results
+        Yields:
+            Workflow step results in execution order
         """
-        results = []
         context = {
             "topic": topic,
             "query": query,
             "max_sources": max_sources,
             "output_format": output_format,
             "sources": [],
-            "verified_sources": [],
+            "credibility": None,
             "synthesis": None
         }
         
         try:
-            # Step 1: Web Research
-            self.logger.info("Step 1: Conducting web research...")
-            research_result = await self.execute_step(
-                step_name="web_research",
-                context=context
-            )
-            results.append(research_result)
+            # Each step consumes the previous step's output, so steps run in order
+            for index, step in enumerate(self.workflow):
+                # Let the next step's agent warm up while this one runs
+                warm_up = self._warm_up_agent(self.workflow[index + 1]) if index + 1 < len(self.workflow) else None
+                
+                self.logger.info("Running step: %s", step.description)
+                step_result = await self.execute_step(
+                    step_name=step.name,
+                    context=context
+                )
+                
+                if warm_up is not None:
+                    await warm_up
+                
+                proceed = self._apply_step_result(step_result, context)
+                yield step_result
+                
+                if not proceed:
+                    return
             
-            if research_result.get("status") == "completed":
-                context["sources"] = research_result.get("result", {}).get("results", [])
-                self.logger.info(f"Collected {len(context['sources'])} sources")
-            else:
-                self.logger.error("Web research failed. Stopping workflow.")
-                return results
+        except Exception as e:
+            self.logger.error("Workflow execution error: %s", e)
+            yield {
+                "step": "workflow_error",
+                "status": AgentStatus.ERROR,
+                "error": str(e)
+            }
+    
+    async def execute_workflow_collect(self, topic: str, query: str, max_sources: int, output_format: str) -> List[Dict[str, Any]]:
+        """
+        Execute the complete research workflow and gather every step result.
+        
+        Args:
+            topic: Research topic
+            query: Search query
+            max_sources: Maximum number of sources to collect
+            output_format: Output format for the report
             
-            # Step 2: Verification
-            self.logger.info("Step 2: Verifying sources...")
-            verification_result = await self.execute_step(
-                step_name="verification",
-                context=context
+        Returns:
+            List of workflow step results
+        """
+        return [
+            step_result async for step_result in self.execute_workflow(
+                topic=topic,
+                query=query,
+                max_sources=max_sources,
+                output_format=output_format
             )
-            results.append(verification_result)
+        ]
+    
+    def _warm_up_agent(self, step: WorkflowStep) -> Optional[asyncio.Future]:
+        """
+        Start optional preparation work for the agent of an upcoming step.
+        
+        Args:
+            step: Workflow step that will run next
             
-            if verification_result.get("status") == "completed":
+        Returns:
+            Future running the agent's prepare(), or None if there is nothing to prepare
+        """
+        _, agent = self._resolved_steps[step.name]
+        if agent is None or not hasattr(agent, "prepare"):
+            return None
+        return asyncio.gather(agent.prepare(), return_exceptions=True)
+    
+    def _apply_step_result(self, step_result: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        """
+        Fold a step result into the workflow context.
+        
+        Args:
+            step_result: Result returned by execute_step
+            context: Current workflow context
+            
+        Returns:
+            False if the workflow should stop, True otherwise
+        """
+        step_name = step_result.get("step")
+        completed = step_result.get("status") == AgentStatus.COMPLETED
+        
+        if step_name == "web_research":
+            if not completed:
+                self.logger.error("Web research failed. Stopping workflow.")
+                return False
+            context["sources"] = step_result.get("result", {}).get("results", [])
+            self.logger.info("Collected %d sources", len(context["sources"]))
+        
+        elif step_name == "verification":
+            if completed:
                 # Filter sources based on verification
-                verification_data = verification_result.get("result", {}).get("verification", {})
-                credibility_score = verification_data.get("credibility_score", 0)
+                verification_data = step_result.get("result", {}).get("verification", {})
+                domains = verification_data.get("source_analysis", {}).get("domains", {})
                 
-                # Keep sources with reasonable credibility
-                context["verified_sources"] = [
-                    source for source in context["sources"]
-                    if self._get_source_credibility(source, verification_data) > 0.3
-                ]
-                self.logger.info(f"Verified {len(context['verified_sources'])} sources")
+                # Sources are filtered against this map when the synthesis message is built
+                context["credibility"] = {
+                    domain: info.get("credibility_score", 0.5)
+                    for domain, info in domains.items()
+                }
+                self.logger.info("Scored credibility for %d domains", len(context["credibility"]))
             else:
                 self.logger.warning("Verification failed. Proceeding with unverified sources.")
-                context["verified_sources"] = context["sources"]
-            
-            # Step 3: Synthesis
-            self.logger.info("Step 3: Synthesizing information...")
-            synthesis_result = await self.execute_step(
-                step_name="synthesis",
-                context=context
-            )
-            results.append(synthesis_result)
-            
-            if synthesis_result.get("status") == "completed":
-                context["synthesis"] = synthesis_result.get("result", {}).get("synthesis", {})
-                self.logger.info("Synthesis completed successfully")
-            else:
+                context["credibility"] = None
+        
+        elif step_name == "synthesis":
+            if not completed:
                 self.logger.error("Synthesis failed. Stopping workflow.")
-                return results
-            
-            # Step 4: Output Generation
-            self.logger.info("Step 4: Generating report...")
-            output_result = await self.execute_step(
-                step_name="output_generation",
-                context=context
-            )
-            results.append(output_result)
-            
-            if output_result.get("status") == "completed":
+                return False
+            context["synthesis"] = step_result.get("result", {}).get("synthesis", {})
+            self.logger.info("Synthesis completed successfully")
+        
+        elif step_name == "output_generation":
+            if completed:
                 self.logger.info("Report generated successfully")
             else:
                 self.logger.error("Report generation failed")
-            
-        except Exception as e:
-            self.logger.error(f"Workflow execution error: {str(e)}")
-            results.append({
-                "step": "workflow_error",
-                "status": "error",
-                "error": str(e)
-            })
         
-        return results
+        return True
     
     async def execute_step(self, step_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -326,147 +443,167 @@ class AgentCoordinator(BaseAgent):
         Returns:
             Step execution result
         """
-        # Find the workflow step
-        step = next((s for s in self.workflow if s.name == step_name), None)
-        if not step:
+        # Find the workflow step and its agent
+        resolved = self._resolved_steps.get(step_name)
+        if not resolved:
             return {
                 "step": step_name,
-                "status": "error",
+                "status": AgentStatus.ERROR,
                 "error": f"Unknown workflow step: {step_name}"
             }
         
-        # Get the agent
-        agent = self.agents.get(step.agent)
+        step, agent = resolved
         if not agent:
             return {
                 "step": step_name,
-                "status": "error",
+                "status": AgentStatus.ERROR,
                 "error": f"Agent not found: {step.agent}"
             }
         
         # Prepare message for the agent
         message = self._prepare_agent_message(step_name, context)
         
-        # Execute the step with timeout
-        try:
-            start_time = datetime.now()
-            
-            self.logger.info(f"Executing step {step_name} with agent {step.agent}")
-            
-            # Run with timeout
-            result = await asyncio.wait_for(
-                agent.process(message),
-                timeout=step.timeout
-            )
-            
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            # Parse result
-            result_content = result.content_dict
-            
-            return {
-                "step": step_name,
-                "agent": step.agent,
-                "status": "completed" if result_content.get("status") == "success" else "error",
-                "result": result_content if result_content.get("status") == "success" else None,
-                "error": result_content.get("error") if result_content.get("status") == "error" else None,
-                "duration": duration,
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat()
-            }
-            
-        except asyncio.TimeoutError:
-            return {
-                "step": step_name,
-                "agent": step.agent,
-                "status": "error",
-                "error": f"Step timed out after {step.timeout} seconds",
-                "duration": step.timeout
-            }
-        except Exception as e:
-            return {
-                "step": step_name,
-                "agent": step.agent,
-                "status": "error",
-                "error": str(e),
-                "duration": 0
-            }
+        # Execute the step with timeout, retrying transient failures
+        start_time = datetime.now()
+        perf_start = time.monotonic()
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                self.logger.info("Executing step %s with agent %s", step_name, step.agent)
+                
+                # Run with timeout, bounded by the concurrency limits
+                async with self._sem, self._step_sem.get(step_name, nullcontext()):
+                    result = await asyncio.wait_for(
+                        agent.process(message),
+                        timeout=step.timeout
+                    )
+                break
+                
+            except Exception as e:
+                if attempt < self.retry_attempts and self._is_retryable(e):
+                    delay = self.retry_backoff * 2 ** attempt
+                    self.logger.warning(
+                        "Step %s failed with a transient error (%s); retrying in %.1fs (attempt %d/%d)",
+                        step_name, type(e).__name__, delay, attempt + 1, self.retry_attempts
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                
+                # Wall time across every attempt and backoff sleep
+                elapsed = time.monotonic() - perf_start
+                if isinstance(e, asyncio.TimeoutError):
+                    return {
+                        "step": step_name,
+                        "agent": step.agent,
+                        "status": AgentStatus.ERROR,
+                        "error": f"Step timed out after {step.timeout} seconds",
+                        "duration": elapsed
+                    }
+                return {
+                    "step": step_name,
+                    "agent": step.agent,
+                    "status": AgentStatus.ERROR,
+                    "error": str(e),
+                    "duration": elapsed
+                }
+        
+        duration = time.monotonic() - perf_start
+        end_time = start_time + timedelta(seconds=duration)
+        
+        # Parse result
+        result_content = result.content_dict
+        
+        return {
+            "step": step_name,
+            "agent": step.agent,
+            "status": AgentStatus.COMPLETED if result_content.get("status") == "success" else AgentStatus.ERROR,
+            "result": result_content if result_content.get("status") == "success" else None,
+            "error": result_content.get("error") if result_content.get("status") == "error" else None,
+            "duration": duration,
+            # Kept as datetimes; AgentMessage.to_wire() (orjson) renders ISO strings
+            "start_time": start_time,
+            "end_time": end_time
+        }
     
-    def _prepare_agent_message(self, step_name: str, context: Dict[str, Any]) -> AgentMessage:
+    def _is_retryable(self, error: Exception) -> bool:
         """
-        Prepare a message for an agent based on the workflow step.
+        Decide whether a step failure is transient and worth retrying.
         
         Args:
-            step_name: Name of the workflow step
-            context: Current workflow context
+            error: Exception raised while running the step
             
         Returns:
-            AgentMessage for the agent
+            True for timeouts and connection problems, False otherwise
         """
-        if step_name == "web_research":
-            return AgentMessage.create(
-                role="user",
-                content={
-                    "query": context.get("query", context.get("topic", "")),
-                    "max_results": context.get("max_sources", 5)
-                }
-            )
-        
-        elif step_name == "verification":
-            return AgentMessage.create(
-                role="user",
-                content={
-                    "content": f"Research on {context.get('topic', '')}",
-                    "sources": context.get("sources", [])
-                }
-            )
-        
-        elif step_name == "synthesis":
-            return AgentMessage.create(
-                role="user",
-                content={
-                    "topic": context.get("topic", ""),
-                    "sources": context.get("verified_sources", [])
-                }
-            )
-        
-        elif step_name == "output_generation":
-            return AgentMessage.create(
-                role="user",
-                content={
-                    "synthesis": context.get("synthesis", {}),
-                    "format": context.get("output_format", "html"),
-                    "include_toc": True
-                }
-            )
-        
-        else:
-            raise ValueError(f"Unknown step: {step_name}")
+        if isinstance(error, AgentExecutionError):
+            error = error.original_exception
+        return isinstance(error, (asyncio.TimeoutError, ConnectionError))
     
-    def _get_source_credibility(self, source: Dict[str, Any], verification_data: Dict[str, Any]) -> float:
+    def _prepare_agent_message(self, step_name: str, context: Dict[str, Any]) -> AgentMessage:
         """
-        Get credibility score for a source.
+        Prepare a message for an agent based on the workflow step.
         
         Args:
-            source: Source dictionary
-            verification_data: Verification results
+            step_name: Name of the workflow step
+            context: Current workflow context
             
         Returns:
-            Credibility score (0.0 to 1.0)
+            AgentMessage for the agent
         """
-        # Simple implementation - can be enhanced
-        domain = source.get("domain", "")
-        
-        # Check domain credibility from verification
-        source_analysis = verification_data.get("source_analysis", {})
-        domains = source_analysis.get("domains", {})
-        
-        if domain in domains:
-            return domains[domain].get("credibility_score", 0.5)
+        try:
+            prepare = self._prep_map[step_name]
+        except KeyError:
+            raise ValueError(f"Unknown step: {step_name}") from None
+        return prepare(context)
+    
+    def _prep_web(self, context: Dict[str, Any]) -> AgentMessage:
+        """Build the web research request."""
+        return AgentMessage.create(
+            role="user",
+            content={
+                "query": context.get("query", context.get("topic", "")),
+                "max_results": context.get("max_sources", 5)
+            }
+        )
+    
+    def _prep_verify(self, context: Dict[str, Any]) -> AgentMessage:
+        """Build the verification request for the collected sources."""
+        return AgentMessage.create(
+            role="user",
+            content={
+                "content": f"Research on {context.get('topic', '')}",
+                "sources": context.get("sources", [])
+            }
+        )
+    
+    def _prep_synth(self, context: Dict[str, Any]) -> AgentMessage:
+        """Build the synthesis request from sources that passed verification."""
+        sources = context.get("sources", [])
+        credibility = context.get("credibility")
+        if credibility is not None:
+            # Keep sources with reasonable credibility (unknown domains default to 0.5)
+            sources = [
+                source for source in sources
+                if credibility.get(source.get("domain", ""), 0.5) > 0.3
+            ]
         
-        # Default credibility
-        return 0.5
+        return AgentMessage.create(
+            role="user",
+            content={
+                "topic": context.get("topic", ""),
+                "sources": sources
+            }
+        )
+    
+    def _prep_output(self, context: Dict[str, Any]) -> AgentMessage:
+        """Build the report generation request."""
+        return AgentMessage.create(
+            role="user",
+            content={
+                "synthesis": context.get("synthesis", {}),
+                "format": context.get("output_format", "html"),
+                "include_toc": True
+            }
+        )
     
     async def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         """
@@ -488,13 +625,59 @@ class AgentCoordinator(BaseAgent):
         }
     
     async def cleanup(self):
-        """Clean up resources."""
-        for agent_name, agent in self.agents.items():
-            if hasattr(agent, 'cleanup'):
-                try:
-                    await agent.cleanup()
-                except Exception as e:
-                    self.logger.warning(f"Error cleaning up agent {agent_name}: {str(e)}")
+        """Clean up resources, closing all agents concurrently."""
+        agents = [(name, agent) for name, agent in self.agents.items() if hasattr(agent, 'cleanup')]
+        results = await asyncio.gather(
+            *(agent.cleanup() for _, agent in agents),
+            return_exceptions=True
+        )
+        
+        for (agent_name, _), result in zip(agents, results):
+            if isinstance(result, Exception):
+                self.logger.warning("Error cleaning up agent %s: %s", agent_name, result)
+
+    def run_in_dedicated_loop(self, message: AgentMessage) -> Future:
+        """
+        Process a message on this coordinator's own event loop thread.
+        
+        The loop and its thread are created on first use and reused for later
+        calls, so workflows of this coordinator never share a loop with unrelated
+        tasks. Once used this way, the coordinator must not also be driven from
+        another event loop.
+        
+        Args:
+            message: AgentMessage containing research request
+            
+        Returns:
+            Future resolving to the workflow result AgentMessage
+        """
+        if self._dedicated_executor is None:
+            self._dedicated_loop = asyncio.new_event_loop()
+            self._dedicated_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"{self.name}-loop"
+            )
+        
+        return self._dedicated_executor.submit(
+            self._dedicated_loop.run_until_complete,
+            self.process(message)
+        )
+    
+    def close_dedicated_loop(self):
+        """Clean up agents on the dedicated loop and shut the loop thread down."""
+        if self._dedicated_executor is None:
+            return
+        
+        try:
+            self._dedicated_executor.submit(
+                self._dedicated_loop.run_until_complete,
+                self.cleanup()
+            ).result()
+        finally:
+            self._dedicated_executor.submit(self._dedicated_loop.close).result()
+            self._dedicated_executor.shutdown(wait=True)
+            self._dedicated_loop = None
+            self._dedicated_executor = None
 
 # Example usage
 async def test_agent_coordinator():
@@ -577,4 +760,9 @@ async def test_agent_coordinator():
         await coordinator.cleanup()
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # Fall back to the default event loop (e.g. on Windows)
     asyncio.run(test_agent_coordinator())
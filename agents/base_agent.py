@@ -1,45 +1,65 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field
-import json
+from dataclasses import dataclass, field, asdict
+from collections import deque
+from datetime import datetime, timezone
+import orjson
 
-class AgentMessage(BaseModel):
+@dataclass(slots=True)
+class AgentMessage:
     role: str
-    content: str  # Always stored as JSON string
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
-    def __init__(self, **data):
-        # Convert content to JSON string if it's a dictionary
-        if 'content' in data and isinstance(data['content'], dict):
-            data['content'] = json.dumps(data['content'])
-        super().__init__(**data)
+    content: Union[str, Dict[str, Any]]  # Dicts are kept as-is for in-process passing
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
     def create(cls, role: str, content: Union[str, dict], **kwargs):
-        """Create a new AgentMessage with automatic content serialization."""
-        if isinstance(content, dict):
-            content = json.dumps(content)
+        """Create a new AgentMessage, keeping dict content unserialized."""
         return cls(role=role, content=content, **kwargs)
 
     @property
     def content_dict(self) -> dict:
         """Get content as a dictionary, parsing from JSON if needed."""
+        if isinstance(self.content, dict):
+            return self.content
         try:
-            return json.loads(self.content)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(self.content)
+        except (orjson.JSONDecodeError, TypeError):
             return {"text": self.content}
 
+    def to_wire(self) -> str:
+        """Serialize content to a JSON string for out-of-process transport."""
+        if isinstance(self.content, dict):
+            return orjson.dumps(self.content).decode()
+        return self.content
+
+    def to_bytes(self) -> bytes:
+        """Serialize the whole message (role, content, metadata) to JSON bytes in one call."""
+        return orjson.dumps(self, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AgentMessage":
+        """Rebuild a message serialized with to_bytes()."""
+        return cls(**orjson.loads(data))
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the message as a plain dictionary."""
+        return asdict(self)
+
 class BaseAgent(ABC):
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.memory = []
+        self.memory = deque(maxlen=512)
     
     @abstractmethod
     async def process(self, message: AgentMessage) -> AgentMessage:
         """Process an incoming message and return a response."""
         pass
     
+    def _now_iso(self) -> str:
+        """Return the current UTC time as a timezone-aware ISO 8601 string."""
+        return datetime.now(timezone.utc).isoformat()
+    
     def log(self, message: str, level: str = "INFO"):
         """Log a message with the agent's name."""
         print(f"[{level}] {self.name}: {message}")
@@ -1,25 +1,38 @@
 import asyncio
-from typing import Dict, List, Optional, Any
+import html
+from typing import ClassVar, Dict, List, Optional, Any, Sequence, TextIO, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
+import io
 from dataclasses import dataclass
-import json
+from collections import defaultdict
 import logging
 from datetime import datetime
 from pathlib import Path
 import os
+import re
+import statistics
+import threading
 import markdown
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template, TemplateNotFound
 from .base_agent import BaseAgent, AgentMessage
 
+# Runs of characters that are not allowed in section anchors
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9]+")
+
 @dataclass
 class ReportSection:
     """Data class to store report sections."""
     title: str
     content: str
     subsections: List['ReportSection'] = None
+    slug: str = ""  # Anchor id, derived from the title when not given
     
     def __post_init__(self):
         if self.subsections is None:
             self.subsections = []
+        if not self.slug:
+            self.slug = _SLUG_STRIP_RE.sub("-", self.title.lower()).strip("-")
 
 @dataclass
 class ReportMetadata:
@@ -32,6 +45,292 @@ class ReportMetadata:
     sources_count: int
     confidence_score: float
 
+_DEFAULT_HTML_TEMPLATE_STR = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #007acc;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #007acc;
+            margin-top: 30px;
+            border-bottom: 2px solid #eee;
+            padding-bottom: 5px;
+        }
+        h3 {
+            color: #555;
+            margin-top: 20px;
+        }
+        .metadata {
+            background-color: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        }
+        .toc {
+            background-color: #f8f9fa;
+            padding: 20px;
+            border-radius: 5px;
+            margin-bottom: 30px;
+        }
+        .toc ul {
+            list-style-type: none;
+            padding-left: 0;
+        }
+        .toc li {
+            margin: 5px 0;
+        }
+        .toc a {
+            color: #007acc;
+            text-decoration: none;
+        }
+        .toc a:hover {
+            text-decoration: underline;
+        }
+        .confidence {
+            background-color: #e8f5e8;
+            padding: 10px;
+            border-radius: 5px;
+            margin: 10px 0;
+        }
+        .high-confidence { background-color: #d4edda; }
+        .medium-confidence { background-color: #fff3cd; }
+        .low-confidence { background-color: #f8d7da; }
+        @media print {
+            body { background-color: white; }
+            .container { box-shadow: none; }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>{{ title }}</h1>
+            <div class="metadata">
+                <strong>Generated:</strong> {{ generated_date }}<br>
+                <strong>Author:</strong> {{ author }}<br>
+                <strong>Version:</strong> {{ version }}<br>
+                <strong>Sources:</strong> {{ sources_count }}<br>
+                <strong>Overall Confidence:</strong> {{ "%.2f"|format(confidence_score) }}
+            </div>
+        </header>
+        
+        {% if include_toc and sections %}
+        <nav class="toc">
+            <h2>Table of Contents</h2>
+            <ul>
+                {% for section in sections %}
+                <li><a href="#{{ section.slug }}">{{ section.title }}</a></li>
+                {% endfor %}
+            </ul>
+        </nav>
+        {% endif %}
+        
+        <main>
+            {% for section in sections %}
+            <section id="{{ section.slug }}">
+                <h2>{{ section.title }}</h2>
+                <div class="section-content">
+                    {{ section.content|safe }}
+                </div>
+            </section>
+            {% endfor %}
+        </main>
+        
+        <footer>
+            <hr>
+            <p><em>This report was generated automatically by {{ author }} on {{ generated_date }}.</em></p>
+        </footer>
+    </div>
+</body>
+</html>
+        """
+
+# Characters dropped from topics when building filenames (\W is the complement
+# of str.isalnum() plus "_", matching the previous per-character filter)
+_FILENAME_STRIP_RE = re.compile(r"\W+")
+
+# Supported output formats and their file extensions
+_FORMAT_EXTENSIONS = {
+    "html": "html",
+    "markdown": "md",
+    "pdf": "pdf"
+}
+
+# WeasyPrint is optional; without it PDF requests fall back to HTML content
+WEASYPRINT_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+
+# PDF-only styles: fixed table layout lets WeasyPrint size columns without
+# measuring every cell; HTML reports keep the browser's automatic layout
+_PDF_STYLESHEET = "table { table-layout: fixed; width: 100%; }"
+
+def _render_pdf_bytes(html_content: str) -> bytes:
+    """Render HTML to PDF bytes. Top-level so it can run in a worker process."""
+    from weasyprint import CSS, HTML
+    # Embedded images are written as fetched rather than recompressed; this is
+    # WeasyPrint's default, spelled out since re-encoding dominates image-heavy reports
+    return HTML(string=html_content).write_pdf(
+        stylesheets=[CSS(string=_PDF_STYLESHEET)], presentational_hints=False, optimize_images=False
+    )
+
+# Per-item layouts for the Markdown-style section bodies
+_FINDING_TMPL = "{i}. {finding}\n   - Confidence: {confidence:.2f}\n   - Sources: {sources}\n"
+_TREND_TMPL = (
+    "\n### Trend {i}: {trend}\n\n"
+    "**Direction:** {direction}\n"
+    "**Confidence:** {confidence:.2f}\n"
+    "**Timeframe:** {timeframe}{evidence}\n"
+)
+_AGREEMENT_TMPL = (
+    "\n### Agreement {i}: {topic}\n\n"
+    "**Consensus Level:** {consensus:.2f}\n"
+    "**Supporting Sources:** {sources}{key_points}\n"
+)
+_DISAGREEMENT_TMPL = (
+    "\n### Disagreement {i}: {topic}\n\n"
+    "**Confidence:** {confidence:.2f}\n"
+    "**Explanation:** {explanation}{views}\n"
+)
+_GAP_TMPL = (
+    "\n### Knowledge Gap {i}: {gap}\n\n"
+    "**Importance:** {importance}{suggested_research}{related_topics}\n"
+)
+
+def _bullet_block(heading: str, items: Sequence[Any]) -> str:
+    """Render a bold heading followed by a bullet per item, or "" when empty."""
+    if not items:
+        return ""
+    return f"\n\n**{heading}:**" + "".join(f"\n- {item}" for item in items)
+
+def _format_key_findings(findings: List[Dict[str, Any]]) -> str:
+    """Format key findings for the report."""
+    # Group by importance
+    by_importance = defaultdict(list)
+    for finding in findings:
+        by_importance[finding.get("importance", "low")].append(finding)
+    
+    # Format by importance level
+    content = []
+    for importance in ("high", "medium", "low"):
+        level_findings = by_importance.get(importance)
+        if level_findings:
+            content.append(f"\n### {importance.title()} Importance Findings\n")
+            content.extend(
+                _FINDING_TMPL.format(
+                    i=i,
+                    finding=finding.get('finding', ''),
+                    confidence=finding.get("confidence", 0),
+                    sources=len(finding.get("sources") or ())
+                )
+                for i, finding in enumerate(level_findings, 1)
+            )
+    
+    return "\n".join(content)
+
+def _format_trends(trends: List[Dict[str, Any]]) -> str:
+    """Format trends for the report."""
+    return "\n".join(
+        _TREND_TMPL.format(
+            i=i,
+            trend=trend.get('trend', ''),
+            direction=trend.get("direction", "unknown").title(),
+            confidence=trend.get("confidence", 0),
+            timeframe=trend.get("timeframe", "unknown"),
+            # Limit to 2 evidence items
+            evidence=_bullet_block("Evidence", (trend.get("evidence") or ())[:2])
+        )
+        for i, trend in enumerate(trends, 1)
+    )
+
+def _format_agreements(agreements: List[Dict[str, Any]]) -> str:
+    """Format agreements for the report."""
+    return "\n".join(
+        _AGREEMENT_TMPL.format(
+            i=i,
+            topic=agreement.get('topic', ''),
+            consensus=agreement.get("consensus_level", 0),
+            sources=len(agreement.get("supporting_sources") or ()),
+            key_points=_bullet_block("Key Points", agreement.get("key_points") or ())
+        )
+        for i, agreement in enumerate(agreements, 1)
+    )
+
+def _format_disagreements(disagreements: List[Dict[str, Any]]) -> str:
+    """Format disagreements for the report."""
+    return "\n".join(
+        _DISAGREEMENT_TMPL.format(
+            i=i,
+            topic=disagreement.get('topic', ''),
+            confidence=disagreement.get("confidence", 0),
+            explanation=disagreement.get('explanation', ''),
+            views=_format_conflicting_views(disagreement.get("conflicting_views") or ())
+        )
+        for i, disagreement in enumerate(disagreements, 1)
+    )
+
+def _format_conflicting_views(conflicting_views: Sequence[Dict[str, Any]]) -> str:
+    """Format the conflicting views block of a disagreement."""
+    if not conflicting_views:
+        return ""
+    
+    return "\n\n**Conflicting Views:**" + "".join(
+        f"\n\n**{view.get('view', 'unknown').title()} View:**" + "".join(
+            # Limit to 2 sentences
+            f"\n- {sentence[0] if isinstance(sentence, tuple) else sentence}"
+            for sentence in (view.get("sentences") or ())[:2]
+        )
+        for view in conflicting_views
+    )
+
+def _format_knowledge_gaps(gaps: List[Dict[str, Any]]) -> str:
+    """Format knowledge gaps for the report."""
+    return "\n".join(
+        _GAP_TMPL.format(
+            i=i,
+            gap=gap.get('gap', ''),
+            importance=gap.get("importance", "low").title(),
+            suggested_research=_bullet_block("Suggested Research", gap.get("suggested_research") or ()),
+            related_topics=(
+                f"\n\n**Related Topics:** {', '.join(gap['related_topics'])}"
+                if gap.get("related_topics") else ""
+            )
+        )
+        for i, gap in enumerate(gaps, 1)
+    )
+
+# Synthesis list fields rendered as report sections, in report order
+_LIST_SECTIONS = (
+    ("key_findings", "Key Findings", _format_key_findings),
+    ("trends", "Identified Trends", _format_trends),
+    ("agreements", "Areas of Agreement", _format_agreements),
+    ("disagreements", "Areas of Disagreement", _format_disagreements),
+    ("knowledge_gaps", "Knowledge Gaps", _format_knowledge_gaps),
+)
+
+# Compiled once at import; the built-in template never changes
+_DEFAULT_HTML_TEMPLATE = Template(_DEFAULT_HTML_TEMPLATE_STR)
+
 class OutputGenerator(BaseAgent):
     """
     Output Generator Agent responsible for:
@@ -41,6 +340,18 @@ class OutputGenerator(BaseAgent):
     - Including proper source citations
     """
     
+    # Reports for syntheses with no sections skip template rendering entirely
+    _EMPTY_HTML = (
+        '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n'
+        '    <title>{title}</title>\n</head>\n<body>\n    <h1>{title}</h1>\n'
+        '    <p><em>No report content was generated on {date}.</em></p>\n</body>\n</html>\n'
+    )
+    _EMPTY_MARKDOWN = "# {title}\n\n*No report content was generated on {date}.*"
+    
+    # Jinja2 environments shared by all instances with the same template settings
+    _ENV_CACHE: ClassVar[Dict[Tuple[str, int, Optional[str]], Environment]] = {}
+    _ENV_CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the OutputGenerator with optional configuration."""
         super().__init__(
@@ -56,26 +367,66 @@ class OutputGenerator(BaseAgent):
         self.default_format = self.config.get("default_format", "html")
         self.author = self.config.get("author", "Autonomous Research Assistant")
         self.version = self.config.get("version", "1.0")
+        self.template_cache_size = self.config.get("template_cache_size", 400)
+        self.template_bytecode_dir = self.config.get("template_bytecode_dir")  # e.g. ".jinja_cache"
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Worker processes for PDF rendering, created on first PDF request
+        self.pdf_workers = self.config.get("pdf_workers", os.cpu_count())
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Syntheses with at least this many list items format their sections in parallel
+        self.parallel_sections_threshold = self.config.get("parallel_sections_threshold", 2000)
+        self._section_pool: Optional[ProcessPoolExecutor] = None
+        
         # Initialize Jinja2 environment
-        self.jinja_env = None
+        self.jinja_env = self._get_shared_jinja_env()
+        self._template_dir_path = Path(self.template_dir)
+        self._available_templates: frozenset = frozenset()
+        self.refresh_templates()
     
-    def _get_jinja_env(self):
-        """Get or create Jinja2 environment."""
-        if self.jinja_env is None:
-            template_path = Path(self.template_dir)
-            if template_path.exists():
-                self.jinja_env = Environment(
-                    loader=FileSystemLoader(self.template_dir),
-                    autoescape=True
-                )
-            else:
-                # Create a simple template if directory doesn't exist
-                self.jinja_env = Environment(loader=FileSystemLoader('.'))
-        return self.jinja_env
+    def _get_shared_jinja_env(self) -> Environment:
+        """Return the environment shared by instances with these template settings."""
+        key = (self.template_dir, self.template_cache_size, self.template_bytecode_dir)
+        with self._ENV_CACHE_LOCK:
+            env = self._ENV_CACHE.get(key)
+            if env is None:
+                env = self._create_jinja_env()
+                self._ENV_CACHE[key] = env
+        return env
+    
+    def _create_jinja_env(self) -> Environment:
+        """Create the Jinja2 environment for template_dir."""
+        bytecode_cache = None
+        if self.template_bytecode_dir:
+            os.makedirs(self.template_bytecode_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(self.template_bytecode_dir)
+        
+        # A missing template_dir simply yields TemplateNotFound on lookup
+        return Environment(
+            loader=FileSystemLoader(self.template_dir),
+            autoescape=True,
+            cache_size=self.template_cache_size,
+            bytecode_cache=bytecode_cache
+        )
+    
+    async def prepare(self):
+        """Compile the report template ahead of report generation."""
+        await asyncio.to_thread(self._load_report_template)
+    
+    def refresh_templates(self):
+        """Rescan template_dir; call after adding or removing template files."""
+        if self._template_dir_path.is_dir():
+            self._available_templates = frozenset(self.jinja_env.list_templates())
+        else:
+            self._available_templates = frozenset()
+    
+    def _load_report_template(self):
+        """Load report_template.html into the environment cache if it exists."""
+        if "report_template.html" in self._available_templates:
+            self.jinja_env.get_template("report_template.html")
     
     async def process(self, message: AgentMessage) -> AgentMessage:
         """
@@ -99,58 +450,50 @@ class OutputGenerator(BaseAgent):
             if not synthesis:
                 raise ValueError("No synthesis data provided for report generation")
             
+            # A list such as ["html", "pdf"] requests several formats at once
+            formats = [output_format] if isinstance(output_format, str) else list(output_format)
+            if not formats:
+                raise ValueError("No output format requested")
+            for fmt in formats:
+                if not isinstance(fmt, str) or fmt.lower() not in _FORMAT_EXTENSIONS:
+                    raise ValueError(f"Unsupported output format: {fmt}")
+            
             self.logger.info(f"Generating {output_format} report for topic: {synthesis.get('topic', 'Unknown')}")
             
             # 1. Create report structure
-            report_sections = await self.create_report_sections(synthesis)
+            report_sections = await self._create_report_sections_async(synthesis)
             
-            # 2. Create metadata
-            metadata = self.create_metadata(synthesis)
+            # 2. Create metadata; one timestamp is shared with the filenames
+            now = datetime.now()
+            metadata = self.create_metadata(synthesis, now)
             
-            # 3. Generate report based on format
-            if output_format.lower() == "html":
-                report_content = await self.generate_html_report(
+            # 3. Generate and save each requested format; formats render
+            # concurrently and html/pdf share one HTML render
+            html_task = None
+            if any(fmt.lower() in ("html", "pdf") for fmt in formats):
+                html_task = asyncio.ensure_future(self.generate_html_report(
                     metadata, report_sections, include_toc, custom_template
-                )
-                file_extension = "html"
-            elif output_format.lower() == "markdown":
-                report_content = await self.generate_markdown_report(
-                    metadata, report_sections, include_toc
-                )
-                file_extension = "md"
-            elif output_format.lower() == "pdf":
-                # For PDF, we'll first generate HTML then convert
-                html_content = await self.generate_html_report(
-                    metadata, report_sections, include_toc, custom_template
-                )
-                report_content = await self.convert_to_pdf(html_content)
-                file_extension = "pdf"
-            else:
-                raise ValueError(f"Unsupported output format: {output_format}")
+                ))
             
-            # 4. Save report to file
-            filename = self.generate_filename(metadata, file_extension)
-            filepath = os.path.join(self.output_dir, filename)
+            reports = await asyncio.gather(*(
+                self._generate_and_save(fmt, metadata, report_sections, include_toc, html_task, now)
+                for fmt in formats
+            ))
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            result_content = {
+                "status": "success",
+                "report": reports[0]
+            }
+            if len(reports) > 1:
+                result_content["reports"] = list(reports)
             
             return AgentMessage.create(
                 role="assistant",
-                content={
-                    "status": "success",
-                    "report": {
-                        "filepath": filepath,
-                        "filename": filename,
-                        "format": output_format,
-                        "size": len(report_content),
-                        "sections": len(report_sections)
-                    }
-                },
+                content=result_content,
                 metadata={
                     "agent": self.name,
                     "format": output_format,
-                    "filepath": filepath
+                    "filepath": reports[0]["filepath"]
                 }
             )
             
@@ -165,12 +508,60 @@ class OutputGenerator(BaseAgent):
                 metadata={"agent": self.name}
             )
     
-    async def create_report_sections(self, synthesis: Dict[str, Any]) -> List[ReportSection]:
+    async def _generate_and_save(self, output_format: str, metadata: ReportMetadata,
+                                 sections: List[ReportSection], include_toc: bool,
+                                 html_task: Optional[asyncio.Future],
+                                 now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Render one output format and write it to the output directory.
+        
+        Args:
+            output_format: Requested format (html, markdown or pdf)
+            metadata: Report metadata
+            sections: Report sections
+            include_toc: Whether to include a table of contents
+            html_task: Shared HTML render, used by the html and pdf formats
+            now: Report timestamp used in the filename
+            
+        Returns:
+            Report info dictionary for the saved file
+        """
+        file_extension = _FORMAT_EXTENSIONS[output_format.lower()]
+        filename = self.generate_filename(metadata, file_extension, now)
+        filepath = os.path.join(self.output_dir, filename)
+        
+        if file_extension == "md":
+            # Markdown is written to the file as it is generated
+            size = await asyncio.to_thread(
+                self._save_markdown_report, filepath, metadata, sections, include_toc
+            )
+        else:
+            if file_extension == "html":
+                report_content = await html_task
+            else:
+                # For PDF, we'll first generate HTML then convert
+                report_content = await self.convert_to_pdf(await html_task)
+            
+            data = report_content.encode('utf-8') if isinstance(report_content, str) else report_content
+            await asyncio.to_thread(Path(filepath).write_bytes, data)
+            size = len(data)
+        
+        return {
+            "filepath": filepath,
+            "filename": filename,
+            "format": output_format,
+            "size": size,
+            "sections": len(sections)
+        }
+    
+    def create_report_sections(self, synthesis: Dict[str, Any],
+                               formatted: Optional[Dict[str, str]] = None) -> List[ReportSection]:
         """
         Create report sections from synthesis data.
         
         Args:
             synthesis: Synthesis results dictionary
+            formatted: Optional pre-rendered section bodies keyed by synthesis field
             
         Returns:
             List of ReportSection objects
@@ -184,50 +575,12 @@ class OutputGenerator(BaseAgent):
                 content=synthesis["executive_summary"]
             ))
         
-        # Key Findings
-        key_findings = synthesis.get("key_findings", [])
-        if key_findings:
-            findings_content = self._format_key_findings(key_findings)
-            sections.append(ReportSection(
-                title="Key Findings",
-                content=findings_content
-            ))
-        
-        # Trends
-        trends = synthesis.get("trends", [])
-        if trends:
-            trends_content = self._format_trends(trends)
-            sections.append(ReportSection(
-                title="Identified Trends",
-                content=trends_content
-            ))
-        
-        # Areas of Agreement
-        agreements = synthesis.get("agreements", [])
-        if agreements:
-            agreements_content = self._format_agreements(agreements)
-            sections.append(ReportSection(
-                title="Areas of Agreement",
-                content=agreements_content
-            ))
-        
-        # Areas of Disagreement
-        disagreements = synthesis.get("disagreements", [])
-        if disagreements:
-            disagreements_content = self._format_disagreements(disagreements)
-            sections.append(ReportSection(
-                title="Areas of Disagreement",
-                content=disagreements_content
-            ))
-        
-        # Knowledge Gaps
-        knowledge_gaps = synthesis.get("knowledge_gaps", [])
-        if knowledge_gaps:
-            gaps_content = self._format_knowledge_gaps(knowledge_gaps)
-            sections.append(ReportSection(
-                title="Knowledge Gaps",
-                content=gaps_content
-            ))
+        # Key findings, trends, agreements, disagreements and knowledge gaps
+        for key, title, formatter in _LIST_SECTIONS:
+            items = synthesis.get(key, [])
+            if items:
+                content = formatted[key] if formatted and key in formatted else formatter(items)
+                sections.append(ReportSection(title=title, content=content))
         
         # Sources
         if synthesis.get("source_count", 0) > 0:
@@ -239,133 +592,42 @@ class OutputGenerator(BaseAgent):
         
         return sections
     
-    def _format_key_findings(self, findings: List[Dict[str, Any]]) -> str:
-        """Format key findings for the report."""
-        content = []
-        
-        # Group by importance
-        by_importance = {}
-        for finding in findings:
-            importance = finding.get("importance", "low")
-            if importance not in by_importance:
-                by_importance[importance] = []
-            by_importance[importance].append(finding)
-        
-        # Format by importance level
-        for importance in ["high", "medium", "low"]:
-            if importance in by_importance:
-                content.append(f"\n### {importance.title()} Importance Findings\n")
-                for i, finding in enumerate(by_importance[importance], 1):
-                    confidence = finding.get("confidence", 0)
-                    sources = len(finding.get("sources", []))
-                    content.append(f"{i}. {finding.get('finding', '')}")
-                    content.append(f"   - Confidence: {confidence:.2f}")
-                    content.append(f"   - Sources: {sources}")
-                    content.append("")
-        
-        return "\n".join(content)
-    
-    def _format_trends(self, trends: List[Dict[str, Any]]) -> str:
-        """Format trends for the report."""
-        content = []
-        
-        for i, trend in enumerate(trends, 1):
-            direction = trend.get("direction", "unknown")
-            confidence = trend.get("confidence", 0)
-            timeframe = trend.get("timeframe", "unknown")
-            
-            content.append(f"\n### Trend {i}: {trend.get('trend', '')}\n")
-            content.append(f"**Direction:** {direction.title()}")
-            content.append(f"**Confidence:** {confidence:.2f}")
-            content.append(f"**Timeframe:** {timeframe}")
-            
-            evidence = trend.get("evidence", [])
-            if evidence:
-                content.append("\n**Evidence:**")
-                for ev in evidence[:2]:  # Limit to 2 evidence items
-                    content.append(f"- {ev}")
-            
-            content.append("")
-        
-        return "\n".join(content)
-    
-    def _format_agreements(self, agreements: List[Dict[str, Any]]) -> str:
-        """Format agreements for the report."""
-        content = []
-        
-        for i, agreement in enumerate(agreements, 1):
-            consensus = agreement.get("consensus_level", 0)
-            sources = len(agreement.get("supporting_sources", []))
-            
-            content.append(f"\n### Agreement {i}: {agreement.get('topic', '')}\n")
-            content.append(f"**Consensus Level:** {consensus:.2f}")
-            content.append(f"**Supporting Sources:** {sources}")
-            
-            key_points = agreement.get("key_points", [])
-            if key_points:
-                content.append("\n**Key Points:**")
-                for point in key_points:
-                    content.append(f"- {point}")
-            
-            content.append("")
-        
-        return "\n".join(content)
-    
-    def _format_disagreements(self, disagreements: List[Dict[str, Any]]) -> str:
-        """Format disagreements for the report."""
-        content = []
-        
-        for i, disagreement in enumerate(disagreements, 1):
-            confidence = disagreement.get("confidence", 0)
-            
-            content.append(f"\n### Disagreement {i}: {disagreement.get('topic', '')}\n")
-            content.append(f"**Confidence:** {confidence:.2f}")
-            content.append(f"**Explanation:** {disagreement.get('explanation', '')}")
-            
-            conflicting_views = disagreement.get("conflicting_views", [])
-            if conflicting_views:
-                content.append("\n**Conflicting Views:**")
-                for view in conflicting_views:
-                    view_type = view.get("view", "unknown")
-                    content.append(f"\n**{view_type.title()} View:**")
-                    sentences = view.get("sentences", [])
-                    for sentence in sentences[:2]:  # Limit to 2 sentences
-                        content.append(f"- {sentence[0] if isinstance(sentence, tuple) else sentence}")
-            
-            content.append("")
-        
-        return "\n".join(content)
-    
-    def _format_knowledge_gaps(self, gaps: List[Dict[str, Any]]) -> str:
-        """Format knowledge gaps for the report."""
-        content = []
+    async def _create_report_sections_async(self, synthesis: Dict[str, Any]) -> List[ReportSection]:
+        """
+        Create report sections, formatting large syntheses in worker processes.
         
-        for i, gap in enumerate(gaps, 1):
-            importance = gap.get("importance", "low")
-            
-            content.append(f"\n### Knowledge Gap {i}: {gap.get('gap', '')}\n")
-            content.append(f"**Importance:** {importance.title()}")
-            
-            suggested_research = gap.get("suggested_research", [])
-            if suggested_research:
-                content.append("\n**Suggested Research:**")
-                for research in suggested_research:
-                    content.append(f"- {research}")
-            
-            related_topics = gap.get("related_topics", [])
-            if related_topics:
-                content.append(f"\n**Related Topics:** {', '.join(related_topics)}")
+        Args:
+            synthesis: Synthesis results dictionary
             
-            content.append("")
-        
-        return "\n".join(content)
+        Returns:
+            List of ReportSection objects
+        """
+        present = [(key, formatter) for key, _, formatter in _LIST_SECTIONS if synthesis.get(key)]
+        total_items = sum(len(synthesis[key]) for key, _ in present)
+        if len(present) < 2 or total_items < self.parallel_sections_threshold:
+            return self.create_report_sections(synthesis)
+        
+        if self._section_pool is None:
+            self._section_pool = ProcessPoolExecutor(max_workers=min(len(_LIST_SECTIONS), os.cpu_count() or 1))
+        
+        loop = asyncio.get_running_loop()
+        contents = await asyncio.gather(*(
+            loop.run_in_executor(self._section_pool, formatter, synthesis[key])
+            for key, formatter in present
+        ))
+        return self.create_report_sections(
+            synthesis,
+            formatted={key: content for (key, _), content in zip(present, contents)}
+        )
     
-    def create_metadata(self, synthesis: Dict[str, Any]) -> ReportMetadata:
-        """Create report metadata."""
+    def create_metadata(self, synthesis: Dict[str, Any], now: Optional[datetime] = None) -> ReportMetadata:
+        """Create report metadata, stamped with ``now`` (defaults to the current time)."""
+        if now is None:
+            now = datetime.now()
         return ReportMetadata(
             title=f"Research Report: {synthesis.get('topic', 'Unknown Topic')}",
             topic=synthesis.get('topic', 'Unknown Topic'),
-            generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            generated_date=now.strftime("%Y-%m-%d %H:%M:%S"),
             author=self.author,
             version=self.version,
             sources_count=synthesis.get('source_count', 0),
@@ -379,32 +641,33 @@ class OutputGenerator(BaseAgent):
         # Confidence from key findings
         key_findings = synthesis.get("key_findings", [])
         if key_findings:
-            avg_finding_confidence = sum(f.get("confidence", 0) for f in key_findings) / len(key_findings)
+            avg_finding_confidence = statistics.fmean(f.get("confidence", 0) for f in key_findings)
             scores.append(avg_finding_confidence)
         
         # Confidence from trends
         trends = synthesis.get("trends", [])
         if trends:
-            avg_trend_confidence = sum(t.get("confidence", 0) for t in trends) / len(trends)
+            avg_trend_confidence = statistics.fmean(t.get("confidence", 0) for t in trends)
             scores.append(avg_trend_confidence)
         
         # Consensus level from agreements
         agreements = synthesis.get("agreements", [])
         if agreements:
-            avg_consensus = sum(a.get("consensus_level", 0) for a in agreements) / len(agreements)
+            avg_consensus = statistics.fmean(a.get("consensus_level", 0) for a in agreements)
             scores.append(avg_consensus)
         
         # Return average or default
-        return sum(scores) / len(scores) if scores else 0.5
+        return statistics.fmean(scores) if scores else 0.5
     
-    def generate_filename(self, metadata: ReportMetadata, extension: str) -> str:
-        """Generate a filename for the report."""
+    def generate_filename(self, metadata: ReportMetadata, extension: str,
+                          now: Optional[datetime] = None) -> str:
+        """Generate a filename for the report, timestamped with ``now`` (defaults to the current time)."""
         # Clean topic for filename
         topic_clean = metadata.topic.lower().replace(" ", "_").replace("/", "_").replace(":", "_")
-        topic_clean = "".join(c for c in topic_clean if c.isalnum() or c == "_")
+        topic_clean = _FILENAME_STRIP_RE.sub("", topic_clean)
         
         # Add timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
         
         return f"research_report_{topic_clean}_{timestamp}.{extension}"
     
@@ -413,7 +676,13 @@ class OutputGenerator(BaseAgent):
                                  include_toc: bool = True,
                                  custom_template: Optional[str] = None) -> str:
         """Generate HTML report."""
-        env = self._get_jinja_env()
+        if not sections:
+            return self._EMPTY_HTML.format(
+                title=html.escape(metadata.title),
+                date=html.escape(metadata.generated_date)
+            )
+        
+        env = self.jinja_env
         
         # Prepare template data
         template_data = {
@@ -424,17 +693,20 @@ class OutputGenerator(BaseAgent):
             "version": metadata.version,
             "sources_count": metadata.sources_count,
             "confidence_score": metadata.confidence_score,
-            "sections": [{"title": s.title, "content": s.content} for s in sections],
+            "sections": [{"title": s.title, "content": s.content, "slug": s.slug} for s in sections],
             "include_toc": include_toc
         }
         
         try:
-            # Try to use custom template if specified
-            if custom_template and os.path.exists(os.path.join(self.template_dir, custom_template)):
-                template = env.get_template(custom_template)
-            elif os.path.exists(os.path.join(self.template_dir, "report_template.html")):
-                template = env.get_template("report_template.html")
-            else:
+            # Try the custom template if specified, then report_template.html;
+            # availability comes from the scan in refresh_templates, not a stat per call
+            names = [
+                name for name in (custom_template, "report_template.html")
+                if name and name in self._available_templates
+            ]
+            try:
+                template = env.select_template(names) if names else self._get_default_html_template()
+            except TemplateNotFound:
                 # Use built-in template
                 template = self._get_default_html_template()
             
@@ -447,184 +719,100 @@ class OutputGenerator(BaseAgent):
     
     def _get_default_html_template(self) -> Template:
         """Get default HTML template."""
-        template_str = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title }}</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #333;
-            border-bottom: 3px solid #007acc;
-            padding-bottom: 10px;
-        }
-        h2 {
-            color: #007acc;
-            margin-top: 30px;
-            border-bottom: 2px solid #eee;
-            padding-bottom: 5px;
-        }
-        h3 {
-            color: #555;
-            margin-top: 20px;
-        }
-        .metadata {
-            background-color: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }
-        .toc {
-            background-color: #f8f9fa;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 30px;
-        }
-        .toc ul {
-            list-style-type: none;
-            padding-left: 0;
-        }
-        .toc li {
-            margin: 5px 0;
-        }
-        .toc a {
-            color: #007acc;
-            text-decoration: none;
-        }
-        .toc a:hover {
-            text-decoration: underline;
-        }
-        .confidence {
-            background-color: #e8f5e8;
-            padding: 10px;
-            border-radius: 5px;
-            margin: 10px 0;
-        }
-        .high-confidence { background-color: #d4edda; }
-        .medium-confidence { background-color: #fff3cd; }
-        .low-confidence { background-color: #f8d7da; }
-        @media print {
-            body { background-color: white; }
-            .container { box-shadow: none; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>{{ title }}</h1>
-            <div class="metadata">
-                <strong>Generated:</strong> {{ generated_date }}<br>
-                <strong>Author:</strong> {{ author }}<br>
-                <strong>Version:</strong> {{ version }}<br>
-                <strong>Sources:</strong> {{ sources_count }}<br>
-                <strong>Overall Confidence:</strong> {{ "%.2f"|format(confidence_score) }}
-            </div>
-        </header>
-        
-        {% if include_toc and sections %}
-        <nav class="toc">
-            <h2>Table of Contents</h2>
-            <ul>
-                {% for section in sections %}
-                <li><a href="#{{ section.title|lower|replace(' ', '-') }}">{{ section.title }}</a></li>
-                {% endfor %}
-            </ul>
-        </nav>
-        {% endif %}
-        
-        <main>
-            {% for section in sections %}
-            <section id="{{ section.title|lower|replace(' ', '-') }}">
-                <h2>{{ section.title }}</h2>
-                <div class="section-content">
-                    {{ section.content|safe }}
-                </div>
-            </section>
-            {% endfor %}
-        </main>
+        return _DEFAULT_HTML_TEMPLATE
+    
+    def generate_markdown_report(self, metadata: ReportMetadata,
+                                 sections: List[ReportSection],
+                                 include_toc: bool = True,
+                                 writer: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Generate Markdown report.
         
-        <footer>
-            <hr>
-            <p><em>This report was generated automatically by {{ author }} on {{ generated_date }}.</em></p>
-        </footer>
-    </div>
-</body>
-</html>
+        Args:
+            metadata: Report metadata
+            sections: Report sections
+            include_toc: Whether to include a table of contents
+            writer: Optional text stream to write the report into
+            
+        Returns:
+            The report text, or None when it was written to ``writer``
         """
-        return Template(template_str)
+        if writer is not None:
+            self._write_markdown_report(writer, metadata, sections, include_toc)
+            return None
+        
+        buffer = io.StringIO()
+        self._write_markdown_report(buffer, metadata, sections, include_toc)
+        return buffer.getvalue()
     
-    async def generate_markdown_report(self, metadata: ReportMetadata,
-                                     sections: List[ReportSection],
-                                     include_toc: bool = True) -> str:
-        """Generate Markdown report."""
-        lines = []
-        
-        # Header
-        lines.append(f"# {metadata.title}")
-        lines.append("")
-        
-        # Metadata
-        lines.append("## Report Metadata")
-        lines.append("")
-        lines.append(f"- **Generated:** {metadata.generated_date}")
-        lines.append(f"- **Author:** {metadata.author}")
-        lines.append(f"- **Version:** {metadata.version}")
-        lines.append(f"- **Sources:** {metadata.sources_count}")
-        lines.append(f"- **Overall Confidence:** {metadata.confidence_score:.2f}")
-        lines.append("")
+    def _write_markdown_report(self, writer: TextIO, metadata: ReportMetadata,
+                               sections: List[ReportSection], include_toc: bool) -> int:
+        """Write the Markdown report piece by piece and return the characters written."""
+        write = writer.write
+        
+        if not sections:
+            return write(self._EMPTY_MARKDOWN.format(title=metadata.title, date=metadata.generated_date))
+        
+        # Header and metadata
+        size = write(
+            f"# {metadata.title}\n\n"
+            "## Report Metadata\n\n"
+            f"- **Generated:** {metadata.generated_date}\n"
+            f"- **Author:** {metadata.author}\n"
+            f"- **Version:** {metadata.version}\n"
+            f"- **Sources:** {metadata.sources_count}\n"
+            f"- **Overall Confidence:** {metadata.confidence_score:.2f}\n\n"
+        )
         
         # Table of Contents
         if include_toc and sections:
-            lines.append("## Table of Contents")
-            lines.append("")
+            size += write("## Table of Contents\n\n")
             for section in sections:
-                lines.append(f"- [{section.title}](#{section.title.lower().replace(' ', '-')})")
-            lines.append("")
+                size += write(f"- [{section.title}](#{section.slug})\n")
+            size += write("\n")
         
         # Sections
         for section in sections:
-            lines.append(f"## {section.title}")
-            lines.append("")
-            lines.append(section.content)
-            lines.append("")
+            size += write(f"## {section.title}\n\n{section.content}\n\n")
         
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*This report was generated automatically by {metadata.author} on {metadata.generated_date}.*")
+        size += write(f"---\n\n*This report was generated automatically by {metadata.author} on {metadata.generated_date}.*")
         
-        return "\n".join(lines)
+        return size
     
-    async def convert_to_pdf(self, html_content: str) -> str:
+    def _save_markdown_report(self, filepath: str, metadata: ReportMetadata,
+                              sections: List[ReportSection], include_toc: bool) -> int:
+        """Stream the Markdown report straight to disk and return its size in bytes (runs in a worker thread)."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            self._write_markdown_report(f, metadata, sections, include_toc)
+            # Write-only text streams report the underlying byte offset
+            return f.tell()
+    
+    async def convert_to_pdf(self, html_content: str) -> Union[str, bytes]:
         """
         Convert HTML to PDF.
-        Note: This is a placeholder implementation.
-        In practice, you would use libraries like weasyprint or pdfkit.
+        
+        Rendering is CPU-bound, so it runs in a process pool rather than on the
+        event loop. Without weasyprint installed the HTML content is returned.
         """
-        # For now, return the HTML content
-        # In a real implementation, you would:
-        # 1. Install weasyprint or pdfkit
-        # 2. Convert HTML to PDF
-        # 3. Return the PDF content
-        self.logger.warning("PDF conversion not implemented. Returning HTML content.")
-        return html_content
+        if not WEASYPRINT_AVAILABLE:
+            self.logger.warning("PDF conversion requires weasyprint. Returning HTML content.")
+            return html_content
+        
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pdf_pool, _render_pdf_bytes, html_content)
+    
+    async def cleanup(self):
+        """Clean up resources."""
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False)
+            self._pdf_pool = None
+        if self._section_pool is not None:
+            self._section_pool.shutdown(wait=False)
+            self._section_pool = None
 
 # Example usage
 async def test_output_generator():
@@ -1,9 +1,97 @@
-from typing import Dict, List, Any, Optional
-import json
-from datetime import datetime
-from ..utils.logger import ResearchLogger
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+import asyncio
+import copy
+import functools
+import hashlib
+import importlib.util
+import time
+import orjson
+from utils.logger import get_logger
 from .base_agent import BaseAgent, AgentMessage
 
+# Fixed parts of the topic analysis and research plan, built once at import.
+# Nested values are immutable (tuples) so they can be shared between results.
+_TOPIC_ANALYSIS_DEFAULTS = MappingProxyType({
+    "scope": "general",  # Could be 'narrow', 'broad', 'specific', etc.
+    "complexity": "medium",  # Could be 'low', 'medium', 'high'
+    "temporal_aspect": None,  # Is this about current events or historical?
+    "geographic_scope": None,  # Is this specific to a region?
+})
+
+_REQUIRED_SOURCES = MappingProxyType({
+    "min": 5,
+    "max": 15,
+    "types": ("academic", "news", "reports")
+})
+
+_STATIC_PLAN_TEMPLATE = MappingProxyType({
+    "estimated_duration_minutes": 60,  # Estimated time to complete research
+    "research_methodology": (
+        "Web search for recent developments",
+        "Academic paper review",
+        "Expert analysis collection"
+    ),
+    "deliverables": (
+        "Executive summary",
+        "Detailed findings",
+        "Source citations",
+        "Recommendations"
+    )
+})
+
+_SUB_QUESTION_TEMPLATE = "What is the current state of %s?"
+
+# Timestamps planner steps stamp on their results; refreshed on cache hits
+# and left out of cache keys so a re-stamped input still hits
+_TIMESTAMP_FIELDS = ("analysis_timestamp", "created_at")
+
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+@dataclass(slots=True)
+class SubQuestion:
+    """A sub-question that guides part of the research."""
+    id: str
+    question: str
+    priority: str = "high"
+    difficulty: str = "medium"
+    embedding_idx: Optional[int] = None  # Row in the batch embedding matrix
+
+def _without_timestamps(value: Any) -> Any:
+    """Drop the _TIMESTAMP_FIELDS from a dict argument before it is hashed into a cache key."""
+    if isinstance(value, dict):
+        return {k: v for k, v in value.items() if k not in _TIMESTAMP_FIELDS}
+    return value
+
+def cached_llm(method):
+    """
+    Cache an LLM-backed planner step in the planner's TTL/LRU cache.
+    
+    Entries are keyed by step name, topic, the step's other arguments, model
+    and prompt version, so bumping ``prompt_version`` in the config invalidates
+    earlier results. Callers always get their own copy of the cached value,
+    with its timestamps set to the time of the call.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, topic: str, *args, **kwargs):
+        key = self._llm_cache_key(method.__name__, topic, args, kwargs)
+        cached = self._get_cached_llm_result(key)
+        if cached is not None:
+            result = copy.deepcopy(cached)
+            if isinstance(result, dict):
+                now = self._now_iso()
+                for field in _TIMESTAMP_FIELDS:
+                    if field in result:
+                        result[field] = now
+            return result
+        
+        result = await method(self, topic, *args, **kwargs)
+        self._store_cached_llm_result(key, copy.deepcopy(result))
+        return result
+    return wrapper
+
 class ResearchPlanner(BaseAgent):
     """
     The ResearchPlanner is responsible for analyzing the research topic,
@@ -16,7 +104,18 @@ class ResearchPlanner(BaseAgent):
             description="Breaks down research topics into actionable sub-questions and creates a research plan"
         )
         self.config = config
-        self.logger = ResearchLogger()
+        self.logger = get_logger()
+        
+        # Cache for LLM-backed planning steps: key -> (stored_at, result)
+        self.llm_cache_size = self.config.get("llm_cache_size", 10000)
+        self.llm_cache_ttl = self.config.get("llm_cache_ttl", 600)  # seconds
+        self._llm_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        
+        # Optional sub-question embeddings (requires sentence-transformers)
+        self.embed_sub_questions = self.config.get("embed_sub_questions", False)
+        self.embedding_model_name = self.config.get("embedding_model", "all-MiniLM-L6-v2")
+        self.embedding_batch_size = self.config.get("embedding_batch_size", 32)
+        self._embedding_model = None
     
     async def process(self, message: AgentMessage) -> AgentMessage:
         """
@@ -29,7 +128,7 @@ class ResearchPlanner(BaseAgent):
             AgentMessage containing the research plan
         """
         try:
-            self.logger.info(f"Planning research for topic: {message.content}")
+            self.logger.info("Planning research for topic: %s", message.content)
             
             # Analyze the topic to understand scope and requirements
             topic_analysis = await self._analyze_topic(message.content)
@@ -40,6 +139,13 @@ class ResearchPlanner(BaseAgent):
                 topic_analysis
             )
             
+            # Embed all sub-questions in one batch for downstream retrieval
+            metadata = {}
+            if self.embed_sub_questions:
+                embeddings = await self._embed_sub_questions(sub_questions)
+                if embeddings is not None:
+                    metadata["sub_question_embeddings"] = embeddings
+            
             # Create a research plan
             research_plan = await self._create_research_plan(
                 message.content,
@@ -50,73 +156,146 @@ class ResearchPlanner(BaseAgent):
             # Log the plan
             self.logger.info("Research plan created successfully")
             
+            # Content stays a dict; AgentMessage serializes it only when needed
             return AgentMessage(
                 role="planner",
-                content=json.dumps({
+                content={
                     "topic_analysis": topic_analysis,
                     "sub_questions": sub_questions,
                     "research_plan": research_plan,
-                    "timestamp": datetime.utcnow().isoformat()
-                }, indent=2)
+                    "timestamp": self._now_iso()
+                },
+                metadata=metadata
             )
             
         except Exception as e:
-            self.logger.error(f"Error in ResearchPlanner: {str(e)}")
+            self.logger.error("Error in ResearchPlanner: %s", e)
             raise
     
+    async def _embed_sub_questions(self, sub_questions: List[SubQuestion]):
+        """
+        Embed all sub-questions with a single batched model call.
+        
+        Each sub-question's embedding_idx is set to its row in the result.
+        
+        Args:
+            sub_questions: Sub-questions to embed
+            
+        Returns:
+            Contiguous float32 array of shape (len(sub_questions), dim), or None
+            if sentence-transformers is not installed
+        """
+        if not sub_questions or not SENTENCE_TRANSFORMERS_AVAILABLE:
+            return None
+        
+        import numpy as np
+        
+        if self._embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+            self._embedding_model = await asyncio.to_thread(SentenceTransformer, self.embedding_model_name)
+        
+        embeddings = await asyncio.to_thread(
+            self._embedding_model.encode,
+            [q.question for q in sub_questions],
+            batch_size=self.embedding_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        for idx, question in enumerate(sub_questions):
+            question.embedding_idx = idx
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    def _llm_cache_key(self, step: str, topic: str, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for an LLM-backed planning step.
+        
+        Args:
+            step: Name of the planning step
+            topic: Research topic
+            args: The step's other positional arguments
+            kwargs: The step's keyword arguments
+            
+        Returns:
+            Hex digest identifying the step's inputs, model and prompt version
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join((
+            step,
+            topic,
+            str(self.config.get("model_name", "")),
+            str(self.config.get("prompt_version", ""))
+        )).encode("utf-8"))
+        # Sorted-key JSON gives equal arguments the same bytes; SubQuestion
+        # dataclasses serialise natively and anything else falls back to repr
+        digest.update(b"\x1f" + orjson.dumps(
+            [_without_timestamps(arg) for arg in args],
+            default=repr, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ))
+        digest.update(b"\x1f" + orjson.dumps(
+            {name: _without_timestamps(value) for name, value in (kwargs or {}).items()},
+            default=repr, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ))
+        return digest.hexdigest()
+    
+    def _get_cached_llm_result(self, key: str) -> Optional[Any]:
+        """Return a cached step result, or None on a miss or expired entry."""
+        entry = self._llm_cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.llm_cache_ttl:
+            del self._llm_cache[key]
+            return None
+        
+        self._llm_cache.move_to_end(key)
+        return result
+    
+    def _store_cached_llm_result(self, key: str, result: Any):
+        """Store a step result, evicting the least recently used entry when full."""
+        if self.llm_cache_size <= 0:
+            return
+        
+        self._llm_cache[key] = (time.monotonic(), result)
+        self._llm_cache.move_to_end(key)
+        while len(self._llm_cache) > self.llm_cache_size:
+            self._llm_cache.popitem(last=False)
+    
+    @cached_llm
     async def _analyze_topic(self, topic: str) -> Dict[str, Any]:
         """Analyze the research topic to understand its scope and requirements."""
         # This would typically involve using an LLM to analyze the topic
         # For now, we'll return a simple analysis
         return {
+            **_TOPIC_ANALYSIS_DEFAULTS,
             "main_topic": topic,
-            "scope": "general",  # Could be 'narrow', 'broad', 'specific', etc.
-            "complexity": "medium",  # Could be 'low', 'medium', 'high'
             "required_domains": [],  # List of knowledge domains
-            "temporal_aspect": None,  # Is this about current events or historical?
-            "geographic_scope": None,  # Is this specific to a region?
-            "analysis_timestamp": datetime.utcnow().isoformat()
+            "analysis_timestamp": self._now_iso()
         }
     
-    async def _generate_sub_questions(self, topic: str, analysis: Dict[str, Any]) -> List[Dict[str, str]]:
+    @cached_llm
+    async def _generate_sub_questions(self, topic: str, analysis: Dict[str, Any]) -> List[SubQuestion]:
         """Generate sub-questions to guide the research."""
         # This would typically involve using an LLM to generate sub-questions
         # For now, we'll return some example sub-questions
+        question = _SUB_QUESTION_TEMPLATE % topic
         return [
-            {
-                "id": f"q{i+1}",
-                "question": f"What is the current state of {topic}?",
-                "priority": "high",
-                "difficulty": "medium"
-            } for i in range(3)  # Generate 3 sub-questions as an example
+            SubQuestion("q%d" % (i + 1), question)
+            for i in range(3)  # Generate 3 sub-questions as an example
         ]
     
-    async def _create_research_plan(self, topic: str, sub_questions: List[Dict[str, str]], 
+    @cached_llm
+    async def _create_research_plan(self, topic: str, sub_questions: List[SubQuestion], 
                                   analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Create a detailed research plan based on the topic and sub-questions."""
         # This would typically involve using an LLM to create a research plan
         # For now, we'll return a simple plan
         return {
+            **_STATIC_PLAN_TEMPLATE,
             "topic": topic,
-            "created_at": datetime.utcnow().isoformat(),
-            "estimated_duration_minutes": 60,  # Estimated time to complete research
-            "required_sources": {
-                "min": 5,
-                "max": 15,
-                "types": ["academic", "news", "reports"]
-            },
-            "sub_questions": sub_questions,
-            "research_methodology": [
-                "Web search for recent developments",
-                "Academic paper review",
-                "Expert analysis collection"
-            ],
-            "deliverables": [
-                "Executive summary",
-                "Detailed findings",
-                "Source citations",
-                "Recommendations"
-            ]
+            "created_at": self._now_iso(),
+            "required_sources": dict(_REQUIRED_SOURCES),
+            "sub_questions": sub_questions
         }
 
     async def validate_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
@@ -127,7 +306,7 @@ class ResearchPlanner(BaseAgent):
             "is_valid": True,
             "feedback": "The research plan looks comprehensive and well-structured.",
             "suggestions": [],
-            "validated_at": datetime.utcnow().isoformat()
+            "validated_at": self._now_iso()
         }
 
     async def adjust_plan_based_on_findings(self, current_plan: Dict[str, Any], 
@@ -135,6 +314,6 @@ class ResearchPlanner(BaseAgent):
         """Adjust the research plan based on initial findings."""
         # This would typically involve using an LLM to adjust the plan
         # For now, we'll return the current plan with an updated timestamp
-        current_plan["last_updated"] = datetime.utcnow().isoformat()
+        current_plan["last_updated"] = self._now_iso()
         current_plan["adjustments_made"] = len(findings) > 0
         return current_plan
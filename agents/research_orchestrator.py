@@ -1,10 +1,123 @@
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from html.parser import HTMLParser
 import asyncio
-import json
+import os
+import aiohttp
+import orjson
 from pathlib import Path
 from .base_agent import BaseAgent, AgentMessage
-from utils.logger import ResearchLogger
+from utils.logger import get_logger
+
+@dataclass(slots=True)
+class PhaseRecord:
+    """Timing and outcome of a single research phase."""
+    name: str
+    start_time: str
+    end_time: str
+    status: str
+    duration_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class ErrorRecord:
+    """An error that stopped the research workflow."""
+    phase: str
+    error: str
+    timestamp: str
+
+@dataclass(slots=True)
+class ResearchState:
+    """Mutable state of a research run, saved by ResearchOrchestrator.save_state."""
+    topic: str
+    start_time: str
+    status: str = "initialized"
+    current_phase: Optional[str] = None
+    end_time: Optional[str] = None
+    queries: List[str] = field(default_factory=list)
+    phases: List[PhaseRecord] = field(default_factory=list)
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+    findings: Dict[str, Any] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+    errors: List[ErrorRecord] = field(default_factory=list)
+
+class _TextExtractor(HTMLParser):
+    """Collects the title and visible text of an HTML document."""
+    
+    _SKIP_TAGS = frozenset(("script", "style", "noscript"))
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.parts: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+    
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+    
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth and not data.isspace():
+            self.parts.append(data.strip())
+
+def parse_source_blob(raw: bytes, content_type: str = "text/html") -> Dict[str, Any]:
+    """
+    Extract the title and plain text from a downloaded source.
+    
+    Top-level so it can run in a worker process; takes raw bytes so only a
+    single buffer is pickled across the process boundary.
+    
+    Args:
+        raw: Response body as downloaded
+        content_type: MIME type of the body
+        
+    Returns:
+        Dictionary with title, text and word_count
+    """
+    decoded = raw.decode("utf-8", errors="replace")
+    if "html" in content_type:
+        extractor = _TextExtractor()
+        extractor.feed(decoded)
+        extractor.close()
+        title, text = extractor.title.strip(), " ".join(extractor.parts)
+    else:
+        title, text = "", decoded
+    
+    return {"title": title, "text": text, "word_count": len(text.split())}
+
+def parse_shared_blob(name: str, size: int, content_type: str = "text/html") -> Dict[str, Any]:
+    """
+    Parse a source body that the orchestrator placed in shared memory.
+    
+    Args:
+        name: Name of the SharedMemory block
+        size: Number of bytes of the block holding the body
+        content_type: MIME type of the body
+        
+    Returns:
+        Same result as parse_source_blob
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        raw = bytes(block.buf[:size])
+    finally:
+        block.close()
+    return parse_source_blob(raw, content_type)
 
 class ResearchOrchestrator(BaseAgent):
     """
@@ -12,6 +125,16 @@ class ResearchOrchestrator(BaseAgent):
     Handles the end-to-end research workflow from topic analysis to final report.
     """
     
+    # Default workflow as (phase name, method name) pairs, run in order
+    PHASES = (
+        ("analysis", "_analyze_topic"),
+        ("planning", "_create_research_plan"),
+        ("collection", "_collect_sources"),
+        ("analysis", "_analyze_sources"),
+        ("synthesis", "_synthesize_findings"),
+        ("reporting", "_generate_report"),
+    )
+    
     def __init__(self, topic: str, config: Dict[str, Any]):
         super().__init__(
             name="ResearchOrchestrator",
@@ -19,25 +142,41 @@ class ResearchOrchestrator(BaseAgent):
         )
         self.topic = topic
         self.config = config
-        self.logger = ResearchLogger()
+        self.logger = get_logger()
         self.agents: Dict[str, BaseAgent] = {}
-        self.research_state: Dict[str, Any] = {
-            "topic": topic,
-            "start_time": datetime.utcnow().isoformat(),
-            "status": "initialized",
-            "phases": [],
-            "sources": [],
-            "findings": {},
-            "warnings": [],
-            "errors": []
-        }
+        
+        # Per-source work in the collection/analysis phases runs concurrently,
+        # bounded to stay under provider rate limits
+        self.max_concurrent_sources = self.config.get("max_concurrent_sources", 5)
+        
+        # Caps in-flight source work across all phases, including re-runs
+        self._sem = asyncio.Semaphore(self.config.get("max_concurrency", 16))
+        
+        # Shared HTTP connection pool, created on first use
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.http_pool_size = self.config.get("http_pool_size", 64)
+        self.http_pool_per_host = self.config.get("http_pool_per_host", 8)
+        
+        # Worker processes for CPU-bound source parsing, started on first use
+        self.cpu_workers = self.config.get("cpu_workers", os.cpu_count() or 1)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Bodies at least this large reach workers through shared memory
+        # instead of being pickled through the pool's pipe
+        self.shm_threshold_bytes = self.config.get("shm_threshold_bytes", 1 << 20)
+        self.research_state = ResearchState(topic=topic, start_time=self._now_iso())
+        self._phase_queue = deque()
+        
+        # Optional append-only JSONL log of phase records, one line per phase
+        self.phase_log_path = self.config.get("phase_log_path")
+        self._phase_log = None
     
     async def process(self, message: AgentMessage) -> AgentMessage:
         """
         Process an incoming message and return a response.
         This is a required method from the BaseAgent class.
         """
-        self.logger.info(f"Processing message: {message.role} - {message.content[:100]}...")
+        self.logger.info("Processing message: %s - %.100s...", message.role, message.to_wire())
         
         # Process the message based on its role and content
         response = f"Processed message about research topic: {self.topic}"
@@ -46,12 +185,10 @@ class ResearchOrchestrator(BaseAgent):
             role="assistant",
             content=response,
             metadata={
-                "processed_at": datetime.utcnow().isoformat(),
+                "processed_at": self._now_iso(),
                 "research_topic": self.topic
             }
         )
-        self.logger = ResearchLogger()
-        self._setup_agents()
     
     def _setup_agents(self):
         """Initialize all required agents for the research process."""
@@ -61,80 +198,136 @@ class ResearchOrchestrator(BaseAgent):
     async def register_agent(self, agent: BaseAgent):
         """Register a new agent with the orchestrator."""
         self.agents[agent.name] = agent
-        self.logger.info(f"Registered agent: {agent.name}")
+        self.logger.info("Registered agent: %s", agent.name)
     
     async def start_research(self):
         """Execute the full research workflow."""
         try:
-            self.research_state["status"] = "in_progress"
-            
-            # 1. Analysis Phase
-            await self._execute_phase("analysis", self._analyze_topic)
-            
-            # 2. Planning Phase
-            await self._execute_phase("planning", self._create_research_plan)
-            
-            # 3. Collection Phase
-            await self._execute_phase("collection", self._collect_sources)
-            
-            # 4. Analysis Phase
-            await self._execute_phase("analysis", self._analyze_sources)
+            self.research_state.status = "in_progress"
             
-            # 5. Synthesis Phase
-            await self._execute_phase("synthesis", self._synthesize_findings)
+            # Phases may enqueue re-runs (e.g. after plan adjustments); they are
+            # drained iteratively so the call depth stays constant
+            self._phase_queue = deque(self.PHASES)
+            report = None
+            while self._phase_queue:
+                phase_name, method_name = self._phase_queue.popleft()
+                result = await self._execute_phase(phase_name, getattr(self, method_name))
+                if phase_name == "reporting":
+                    report = result
             
-            # 6. Reporting Phase
-            report = await self._execute_phase("reporting", self._generate_report)
-            
-            self.research_state["status"] = "completed"
-            self.research_state["end_time"] = datetime.utcnow().isoformat()
+            self.research_state.status = "completed"
+            self.research_state.end_time = self._now_iso()
             
             return report
             
         except Exception as e:
-            self.research_state["status"] = "failed"
-            self.research_state["errors"].append({
-                "phase": self.research_state.get("current_phase", "unknown"),
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            self.logger.error(f"Research failed: {str(e)}")
+            self.research_state.status = "failed"
+            self.research_state.errors.append(ErrorRecord(
+                phase=self.research_state.current_phase or "unknown",
+                error=str(e),
+                timestamp=self._now_iso()
+            ))
+            self.logger.error("Research failed: %s", e)
             raise
+        
+        finally:
+            await self.aclose()
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating its connection pool if needed."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.http_pool_size,
+                    limit_per_host=self.http_pool_per_host
+                )
+            )
+        return self.session
+    
+    async def aclose(self):
+        """Close the HTTP session, the parsing pool and the phase log."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False)
+            self._cpu_pool = None
+        
+        if self._phase_log is not None:
+            self._phase_log.close()
+            self._phase_log = None
+    
+    def enqueue_phase(self, phase_name: str, method_name: str):
+        """
+        Schedule a phase to run after the currently queued ones.
+        
+        Args:
+            phase_name: Name recorded in the research state
+            method_name: Name of the orchestrator coroutine method to run
+        """
+        self._phase_queue.append((phase_name, method_name))
     
     async def _execute_phase(self, phase_name: str, phase_func):
         """Execute a research phase with proper state management."""
-        phase_start = datetime.utcnow()
-        self.research_state["current_phase"] = phase_name
-        self.logger.info(f"Starting phase: {phase_name}")
+        phase_start = datetime.now(timezone.utc)
+        phase_start_iso = phase_start.isoformat()
+        self.research_state.current_phase = phase_name
+        self.logger.info("Starting phase: %s", phase_name)
         
         try:
             result = await phase_func()
-            phase_end = datetime.utcnow()
+            phase_end = datetime.now(timezone.utc)
             
-            self.research_state["phases"].append({
-                "name": phase_name,
-                "start_time": phase_start.isoformat(),
-                "end_time": phase_end.isoformat(),
-                "duration_seconds": (phase_end - phase_start).total_seconds(),
-                "status": "completed"
-            })
+            self._record_phase(PhaseRecord(
+                name=phase_name,
+                start_time=phase_start_iso,
+                end_time=phase_end.isoformat(),
+                status="completed",
+                duration_seconds=(phase_end - phase_start).total_seconds()
+            ))
             
             return result
             
         except Exception as e:
-            self.research_state["phases"].append({
-                "name": phase_name,
-                "start_time": phase_start.isoformat(),
-                "end_time": datetime.utcnow().isoformat(),
-                "status": "failed",
-                "error": str(e)
-            })
-            self.logger.error(f"Phase {phase_name} failed: {str(e)}")
+            self._record_phase(PhaseRecord(
+                name=phase_name,
+                start_time=phase_start_iso,
+                end_time=self._now_iso(),
+                status="failed",
+                error=str(e)
+            ))
+            self.logger.error("Phase %s failed: %s", phase_name, e)
             raise
     
+    def _record_phase(self, record: PhaseRecord):
+        """Add a phase record to the state and append it to the phase log, if enabled."""
+        self.research_state.phases.append(record)
+        if not self.phase_log_path:
+            return
+        
+        if self._phase_log is None:
+            self._phase_log = open(self.phase_log_path, "ab")
+        self._phase_log.write(orjson.dumps(record) + b"\n")
+        self._phase_log.flush()
+    
+    @staticmethod
+    def load_phase_log(path: str) -> List[PhaseRecord]:
+        """
+        Rebuild phase records from an append-only phase log.
+        
+        Args:
+            path: Path of the JSONL file written via ``phase_log_path``
+            
+        Returns:
+            Phase records in the order they were written
+        """
+        with open(path, "rb") as f:
+            return [PhaseRecord(**orjson.loads(line)) for line in f if line.strip()]
+    
     async def _analyze_topic(self):
         """Analyze the research topic to understand scope and requirements."""
-        self.logger.info(f"Analyzing research topic: {self.topic}")
+        self.logger.info("Analyzing research topic: %s", self.topic)
         # Will be implemented with topic analysis logic
         
     async def _create_research_plan(self):
@@ -145,12 +338,83 @@ class ResearchOrchestrator(BaseAgent):
     async def _collect_sources(self):
         """Collect and process sources based on the research plan."""
         self.logger.info("Collecting research sources...")
+        queries = self.research_state.queries or [self.topic]
+        results = await self._gather_bounded(self._collect_from_query(query) for query in queries)
+        for sources in results:
+            self.research_state.sources.extend(sources or [])
+    
+    async def _collect_from_query(self, query: str) -> List[Dict[str, Any]]:
+        """Collect sources for a single search query."""
         # Will be implemented with source collection logic
+        return []
     
     async def _analyze_sources(self):
         """Analyze and validate collected sources."""
         self.logger.info("Analyzing collected sources...")
-        # Will be implemented with source analysis logic
+        return await self._gather_bounded(
+            self._analyze_source(source) for source in self.research_state.sources
+        )
+    
+    async def _analyze_source(self, source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Analyze and validate a single source."""
+        raw = source.get("raw")
+        if raw is None:
+            return None
+        
+        # Parsing is CPU-bound; keep it off the event loop
+        return await self._parse_in_pool(raw, source.get("content_type", "text/html"))
+    
+    async def _parse_in_pool(self, raw: bytes, content_type: str) -> Dict[str, Any]:
+        """Run parse_source_blob in the worker process pool."""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        
+        loop = asyncio.get_running_loop()
+        if len(raw) < self.shm_threshold_bytes:
+            return await loop.run_in_executor(self._cpu_pool, parse_source_blob, raw, content_type)
+        
+        block = shared_memory.SharedMemory(create=True, size=len(raw))
+        try:
+            block.buf[:len(raw)] = raw
+            return await loop.run_in_executor(
+                self._cpu_pool, parse_shared_blob, block.name, len(raw), content_type
+            )
+        finally:
+            block.close()
+            block.unlink()
+    
+    async def _gather_bounded(self, coros) -> List[Any]:
+        """
+        Run coroutines on a fixed pool of workers pulling from a shared queue.
+        
+        At most max_concurrent_sources workers are started, however many jobs
+        are queued. Results are returned in submission order.
+        """
+        jobs = deque(enumerate(coros))
+        results: List[Any] = [None] * len(jobs)
+        
+        async def worker():
+            while jobs:
+                index, coro = jobs.popleft()
+                async with self._sem:
+                    results[index] = await coro
+        
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrent_sources, len(jobs)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # If a worker failed, stop the others before the caller closes the
+            # session and process pool, and close jobs that never started;
+            # the first failure propagates unchanged
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            while jobs:
+                jobs.popleft()[1].close()
+        return results
     
     async def _synthesize_findings(self):
         """Synthesize findings from all analyzed sources."""
@@ -165,10 +429,13 @@ class ResearchOrchestrator(BaseAgent):
     def save_state(self, path: Optional[str] = None):
         """Save the current research state to a file."""
         if path is None:
-            path = f"research_state_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+            path = f"research_state_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(path, 'w') as f:
-            json.dump(self.research_state, f, indent=2)
+        # Compact output by default; indented JSON only when debugging.
+        # orjson serialises the state dataclasses directly to bytes.
+        option = orjson.OPT_INDENT_2 if self.config.get("debug") else 0
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(self.research_state, option=option))
         
-        self.logger.info(f"Research state saved to {path}")
+        self.logger.info("Research state saved to %s", path)
         return path
@@ -1,17 +1,231 @@
 import asyncio
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, field
-import json
+from typing import Dict, List, Optional, Any, Set, Iterable
+from dataclasses import dataclass, field, asdict
+from array import array
+from collections import OrderedDict, defaultdict
+import orjson
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urlparse
 import hashlib
+import math
+import os
+import random
+import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import aiofiles
 from .base_agent import BaseAgent, AgentMessage
 
-@dataclass
+# Connection tuning applied to every database connection. WAL lets readers
+# proceed while a write is in progress; NORMAL sync is durable in WAL mode
+# except for the last transactions on power loss.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+# Bumped when stored derived columns change; see _migrate_schema
+_SCHEMA_VERSION = 4
+
+# Per-connection prepared statement cache; hot queries below use constant
+# SQL text so they are parsed once per connection
+_STATEMENT_CACHE_SIZE = 256
+
+def _content_hash(content: str) -> str:
+    """Hash source content; OpenSSL's SHA-256 uses SHA-NI/ARMv8 crypto instructions when present."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+# Form of the hashes _content_hash produces; supplied hashes in any other
+# form (legacy MD5, placeholders) are recomputed
+_CONTENT_HASH_RE = re.compile(r"[0-9a-f]{64}")
+
+# Source fields only; skips the title signature blob
+_SOURCE_COLUMNS = (
+    "id, url, title, content, domain, author, publish_date, "
+    "last_accessed, credibility_score, tags, metadata, content_hash"
+)
+
+# search_sources filters in the order their predicates and parameters appear
+_SEARCH_CLAUSES = {
+    "url": " AND url LIKE ?",
+    "domain": " AND domain = ?",
+    "title": " AND title LIKE ?",
+    "content": " AND content LIKE ?",
+    "tags": " AND id IN (SELECT source_id FROM source_tags WHERE tag = ?)",
+    "min_credibility": " AND credibility_score >= ?",
+    "date_from": " AND publish_date >= ?",
+    "date_to": " AND publish_date <= ?",
+}
+_LIKE_FILTERS = ("url", "title", "content")
+_FTS_FILTERS = ("title", "content")
+
+@lru_cache(maxsize=64)
+def _build_search_sql(filter_keys: tuple, tag_count: int, use_fts: bool) -> str:
+    """
+    Build the search_sources SQL for one combination of filters.
+    
+    Args:
+        filter_keys: Filters present in the query, in _SEARCH_CLAUSES order
+        tag_count: Number of tags to match (each adds a predicate)
+        use_fts: Whether an FTS MATCH narrows the rows before the LIKE filters
+        
+    Returns:
+        Parameterised SQL ending in LIMIT ? OFFSET ?
+    """
+    sql = f"SELECT {_SOURCE_COLUMNS} FROM sources WHERE 1=1"
+    for key in filter_keys:
+        sql += _SEARCH_CLAUSES[key] * (tag_count if key == "tags" else 1)
+    if use_fts:
+        sql += " AND rowid IN (SELECT rowid FROM sources_fts WHERE sources_fts MATCH ?)"
+    return sql + " ORDER BY last_accessed DESC LIMIT ? OFFSET ?"
+
+def _json_blob(value: Any) -> bytes:
+    """Serialise a tags/metadata/sources value as JSON bytes for storage."""
+    # Stored as a BLOB without a str round-trip; orjson.loads reads these
+    # and older TEXT values alike. NON_STR_KEYS keeps stdlib json's tolerance
+    # for int keys in metadata.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+@lru_cache(maxsize=4096)
+def _encode_tag_tuple(tags: tuple) -> bytes:
+    return _json_blob(list(tags))
+
+def _encode_tags(tags: Any) -> bytes:
+    """Serialise a tags list, memoised since many sources share the same tags."""
+    # Only all-string lists key the cache: equal-comparing values such as 1,
+    # 1.0 and True would otherwise share one encoding
+    if isinstance(tags, list) and all(type(tag) is str for tag in tags):
+        return _encode_tag_tuple(tuple(tags))
+    return _json_blob(tags)
+
+def _source_id(url: str, title: str, content: str) -> str:
+    """Derive a source ID from its URL, title and leading content."""
+    return hashlib.blake2b(f"{url}{title}{content[:100]}".encode(), digest_size=8).hexdigest()
+
+@lru_cache(maxsize=8192)
+def _extract_domain(url: str) -> str:
+    """Extract the domain from a URL; cached since sources often share pages of one site."""
+    try:
+        domain = urlparse(url).netloc.lower()
+    except ValueError:
+        return "unknown"
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain
+
+def _fts_substring(text: str) -> Optional[str]:
+    """
+    Quote text as a trigram FTS5 phrase matching every row that contains it.
+    
+    Returns None when the index can't narrow the search: trigrams need at
+    least three characters, and LIKE wildcards have no phrase equivalent.
+    """
+    if len(text) < 3 or "%" in text or "_" in text:
+        return None
+    return '"%s"' % text.replace('"', '""')
+
+class _MinHashLSH:
+    """
+    MinHash signatures over title word sets, bucketed into LSH bands.
+    
+    Titles whose word-set Jaccard similarity is high share at least one band
+    with high probability, so near-duplicate candidates are found with a few
+    dictionary probes instead of a table scan. Candidates still need an exact
+    similarity check.
+    """
+    
+    _PRIME = (1 << 61) - 1
+    
+    def __init__(self, num_perm: int = 100, bands: int = 20, seed: int = 1):
+        rng = random.Random(seed)
+        self.perms = [(rng.randrange(1, self._PRIME), rng.randrange(self._PRIME)) for _ in range(num_perm)]
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: Dict[int, Set[str]] = defaultdict(set)
+    
+    def signature(self, text: str) -> Optional[array]:
+        """Return the MinHash signature of the text's lowercase word set, or None if empty."""
+        words = set(text.lower().split())
+        if not words:
+            return None
+        
+        hashes = [int.from_bytes(hashlib.blake2b(w.encode(), digest_size=8).digest(), "little") for w in words]
+        prime = self._PRIME
+        return array("I", (
+            min((a * h + b) % prime for h in hashes) & 0xFFFFFFFF
+            for a, b in self.perms
+        ))
+    
+    def _band_keys(self, signature: array) -> Iterable[int]:
+        rows = self.rows
+        return (hash((i, tuple(signature[i * rows:(i + 1) * rows]))) for i in range(self.bands))
+    
+    def insert(self, key: str, signature: Optional[array]):
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            self.buckets[band_key].add(key)
+    
+    def remove(self, key: str, signature: Optional[array]):
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+    
+    def query(self, signature: Optional[array]) -> Set[str]:
+        if signature is None:
+            return set()
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        return candidates
+
+def _signature_from_blob(blob: Optional[bytes]) -> Optional[array]:
+    """Decode a signature stored in the sources.minhash column."""
+    if not blob:
+        return None
+    signature = array("I")
+    signature.frombytes(blob)
+    return signature
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+    
+    Answers "definitely not seen" without touching the database; a positive
+    answer may be a false positive and must be confirmed with a query.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+    
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+@dataclass(slots=True)
 class Source:
     """Data class to represent a source."""
     id: str
@@ -25,17 +239,20 @@ class Source:
     credibility_score: float = 0.5
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    content_hash: str = ""
     
     def __post_init__(self):
         if not self.id:
             self.id = self.generate_id()
+        # Hash once here; rows loaded from the database pass the stored value
+        if not self.content_hash:
+            self.content_hash = _content_hash(self.content)
     
     def generate_id(self) -> str:
         """Generate unique ID for the source."""
-        content_hash = hashlib.md5(f"{self.url}{self.title}{self.content[:100]}".encode()).hexdigest()
-        return content_hash[:16]
+        return _source_id(self.url, self.title, self.content)
 
-@dataclass
+@dataclass(slots=True)
 class SourceCollection:
     """Data class to represent a collection of sources."""
     id: str
@@ -55,6 +272,42 @@ class SourceManager(BaseAgent):
     - Deduplication and versioning
     """
     
+    _SQL_DUP_URL = "SELECT id FROM sources WHERE url = ?"
+    _SQL_DUP_HASH = "SELECT id FROM sources WHERE content_hash = ?"
+    _SQL_GET_SOURCE = f"SELECT {_SOURCE_COLUMNS} FROM sources WHERE id = ?"
+    _SQL_GET_MINHASH = "SELECT minhash FROM sources WHERE id = ?"
+    _SQL_DELETE_SOURCE = "DELETE FROM sources WHERE id = ?"
+    _SQL_DELETE_RELATIONS = "DELETE FROM source_relations WHERE source_id1 = ? OR source_id2 = ?"
+    _SQL_INSERT_TAG = "INSERT OR IGNORE INTO source_tags (source_id, tag) VALUES (?, ?)"
+    _SQL_DELETE_TAGS = "DELETE FROM source_tags WHERE source_id = ?"
+    _SQL_GET_COLLECTION = "SELECT * FROM collections WHERE id = ?"
+    # Upserts update rows in place: rowid (and so sources_fts) stays stable and
+    # created_date survives, where REPLACE would delete and re-insert
+    _SQL_INSERT_SOURCE = """
+        INSERT INTO sources 
+        (id, url, title, content, domain, author, publish_date, last_accessed, 
+         credibility_score, tags, metadata, content_hash, minhash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            url = excluded.url, title = excluded.title, content = excluded.content,
+            domain = excluded.domain, author = excluded.author,
+            publish_date = excluded.publish_date, last_accessed = excluded.last_accessed,
+            credibility_score = excluded.credibility_score, tags = excluded.tags,
+            metadata = excluded.metadata, content_hash = excluded.content_hash,
+            minhash = excluded.minhash
+    """
+    # Positions of the fields add_sources reads back from _SQL_INSERT_SOURCE rows
+    _ROW_ID, _ROW_URL, _ROW_TITLE, _ROW_CONTENT_HASH = 0, 1, 2, 11
+    _SQL_UPSERT_COLLECTION = """
+        INSERT INTO collections 
+        (id, name, description, sources, created_date, last_updated, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name, description = excluded.description,
+            sources = excluded.sources, created_date = excluded.created_date,
+            last_updated = excluded.last_updated, metadata = excluded.metadata
+    """
+    
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the SourceManager with optional configuration."""
         super().__init__(
@@ -74,21 +327,90 @@ class SourceManager(BaseAgent):
         
         # Initialize database
         self.db_connection = None
+        self.fts_enabled = False
+        self._title_lsh = _MinHashLSH()
         self._initialize_database()
         
+        # All writes run on one thread that owns db_connection; reads run on a
+        # small pool with a connection per thread, which WAL lets proceed
+        # alongside the writer. Keeps SQLite calls off the event loop.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SourceManager-writer")
+        if self.db_path == ":memory:":
+            # Other connections would open a different in-memory database
+            self._readers = self._writer
+        else:
+            self._readers = ThreadPoolExecutor(
+                max_workers=self.config.get("db_reader_threads", 4),
+                thread_name_prefix="SourceManager-reader"
+            )
+        self._reader_local = threading.local()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        
+        # Load stored title signatures into the near-duplicate index
+        for row in self.db_connection.execute("SELECT id, minhash FROM sources WHERE minhash IS NOT NULL"):
+            self._title_lsh.insert(row["id"], _signature_from_blob(row["minhash"]))
+        
+        # Bloom filter over stored URLs and content hashes; lets most
+        # duplicate probes skip SQLite entirely
+        self._key_filter = _BloomFilter(
+            self.config.get("bloom_capacity", 1_000_000),
+            self.config.get("bloom_error_rate", 1e-4)
+        )
+        for row in self.db_connection.execute("SELECT url, content_hash FROM sources"):
+            self._key_filter.add(row["url"])
+            if row["content_hash"]:
+                self._key_filter.add(row["content_hash"])
+        
+        # Checkpoint the WAL from a background thread so automatic checkpoints
+        # don't stall the event loop; 0 disables it
+        self.wal_checkpoint_interval = self.config.get("wal_checkpoint_interval", 60)
+        self._checkpoint_stop = threading.Event()
+        self._checkpoint_thread = None
+        if self.db_path != ":memory:" and self.wal_checkpoint_interval > 0:
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_loop, name="SourceManager-wal-checkpoint", daemon=True
+            )
+            self._checkpoint_thread.start()
+        
         # Cache for frequently accessed sources
-        self.source_cache = {}
+        # LRU order: most recently used last. The lock keeps each cache
+        # operation atomic when the manager is shared across threads.
+        # Holds the source dicts get_source returns, so hits build nothing
+        self.source_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.RLock()
         self.cache_size_limit = self.config.get("cache_size_limit", 1000)
+        self.max_search_limit = self.config.get("max_search_limit", 1000)
         
         # Deduplication settings
         self.duplicate_threshold = self.config.get("duplicate_threshold", 0.8)
+        # Serialises add_sources' duplicate probe and insert so concurrent
+        # batches see each other's rows before deciding what is new
+        self._ingest_lock = asyncio.Lock()
+        
+        # Batches at least this large trigger ANALYZE after insertion
+        self.analyze_batch_size = self.config.get("analyze_batch_size", 500)
+        
+        # Batches with at least this much content are hashed on a thread pool;
+        # hashlib releases the GIL on large buffers, so threads hash in parallel
+        self.parallel_hash_bytes = self.config.get("parallel_hash_bytes", 4 * 1024 * 1024)
+        self.hash_workers = self.config.get("hash_workers", os.cpu_count() or 1)
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
     
     def _initialize_database(self):
         """Initialize the SQLite database."""
         try:
-            self.db_connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.db_connection = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+            )
             self.db_connection.row_factory = sqlite3.Row
             
+            if self.db_path != ":memory:":
+                self.db_connection.execute("PRAGMA journal_mode=WAL")
+                self.db_connection.execute("PRAGMA wal_autocheckpoint=1000")
+            for pragma in _CONNECTION_PRAGMAS:
+                self.db_connection.execute(pragma)
+            
             # Create tables
             self.db_connection.execute("""
                 CREATE TABLE IF NOT EXISTS sources (
@@ -101,10 +423,11 @@ class SourceManager(BaseAgent):
                     publish_date TEXT,
                     last_accessed TEXT,
                     credibility_score REAL,
-                    tags TEXT,  -- JSON array
-                    metadata TEXT,  -- JSON object
+                    tags TEXT,  -- JSON array (UTF-8 BLOB)
+                    metadata TEXT,  -- JSON object (UTF-8 BLOB)
                     content_hash TEXT,
-                    created_date TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_date TEXT DEFAULT CURRENT_TIMESTAMP,
+                    minhash BLOB  -- MinHash signature of the title words
                 )
             """)
             
@@ -113,10 +436,10 @@ class SourceManager(BaseAgent):
                     id TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
                     description TEXT,
-                    sources TEXT,  -- JSON array of source IDs
+                    sources TEXT,  -- JSON array of source IDs (UTF-8 BLOB)
                     created_date TEXT,
                     last_updated TEXT,
-                    metadata TEXT  -- JSON object
+                    metadata TEXT  -- JSON object (UTF-8 BLOB)
                 )
             """)
             
@@ -131,11 +454,40 @@ class SourceManager(BaseAgent):
                 )
             """)
             
+            # One row per (source, tag) so tag filters are index lookups rather
+            # than scans of the JSON tags column
+            self.db_connection.execute("""
+                CREATE TABLE IF NOT EXISTS source_tags (
+                    source_id TEXT,
+                    tag TEXT COLLATE NOCASE,
+                    PRIMARY KEY (source_id, tag)
+                )
+            """)
+            
             # Create indexes for better performance
+            self.db_connection.execute("CREATE INDEX IF NOT EXISTS idx_source_tags_tag ON source_tags(tag, source_id)")
             self.db_connection.execute("CREATE INDEX IF NOT EXISTS idx_sources_url ON sources(url)")
-            self.db_connection.execute("CREATE INDEX IF NOT EXISTS idx_sources_domain ON sources(domain)")
             self.db_connection.execute("CREATE INDEX IF NOT EXISTS idx_sources_content_hash ON sources(content_hash)")
             
+            # Composite indexes for search_sources filters, ordered like its
+            # last_accessed DESC sort; (domain, last_accessed) supersedes the
+            # old single-column domain index
+            self.db_connection.execute("DROP INDEX IF EXISTS idx_sources_domain")
+            self.db_connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sources_domain_last ON sources(domain, last_accessed DESC)"
+            )
+            self.db_connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sources_cred_last ON sources(credibility_score, last_accessed DESC)"
+            )
+            self.db_connection.execute("CREATE INDEX IF NOT EXISTS idx_sources_pubdate ON sources(publish_date)")
+            # Unfiltered searches walk this in sort order instead of sorting the table
+            self.db_connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sources_last_accessed ON sources(last_accessed DESC)"
+            )
+            
+            self._initialize_fts()
+            self._migrate_schema()
+            
             self.db_connection.commit()
             self.logger.info("Database initialized successfully")
             
@@ -143,6 +495,184 @@ class SourceManager(BaseAgent):
             self.logger.error(f"Error initializing database: {str(e)}")
             raise
     
+    def _migrate_schema(self):
+        """Bring rows written by older versions up to _SCHEMA_VERSION."""
+        version = self.db_connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        
+        # Version 1: content_hash moved from MD5 to SHA-256
+        if version < 1:
+            rows = self.db_connection.execute("SELECT id, content FROM sources").fetchall()
+            self.db_connection.executemany(
+                "UPDATE sources SET content_hash = ? WHERE id = ?",
+                [(_content_hash(row["content"] or ""), row["id"]) for row in rows]
+            )
+        
+        # Version 2: title MinHash signatures for near-duplicate lookup
+        if version < 2:
+            columns = {row["name"] for row in self.db_connection.execute("PRAGMA table_info(sources)")}
+            if "minhash" not in columns:
+                self.db_connection.execute("ALTER TABLE sources ADD COLUMN minhash BLOB")
+            rows = self.db_connection.execute("SELECT id, title FROM sources").fetchall()
+            self.db_connection.executemany(
+                "UPDATE sources SET minhash = ? WHERE id = ?",
+                [(self._signature_blob(row["title"] or ""), row["id"]) for row in rows]
+            )
+        
+        # Version 3: tags normalised into source_tags
+        if version < 3:
+            rows = self.db_connection.execute("SELECT id, tags FROM sources").fetchall()
+            self.db_connection.executemany(
+                self._SQL_INSERT_TAG,
+                [(row["id"], tag) for row in rows for tag in orjson.loads(row["tags"] or "[]")]
+            )
+        
+        # Version 4: sources_fts re-created as a trigram index over title/content
+        if version < 4:
+            self.db_connection.executescript("""
+                DROP TRIGGER IF EXISTS sources_fts_ai;
+                DROP TRIGGER IF EXISTS sources_fts_ad;
+                DROP TRIGGER IF EXISTS sources_fts_au;
+                DROP TABLE IF EXISTS sources_fts;
+            """)
+            self.fts_enabled = False
+            self._initialize_fts()
+        
+        self.db_connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self.logger.info(f"Migrated sources from schema version {version} to {_SCHEMA_VERSION}")
+    
+    def _signature_blob(self, title: str) -> Optional[bytes]:
+        """Compute a title signature in its stored form."""
+        signature = self._title_lsh.signature(title)
+        return signature.tobytes() if signature is not None else None
+    
+    def _initialize_fts(self):
+        """Create the FTS5 trigram index over title/content, if SQLite supports it."""
+        fts_exists = self.db_connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sources_fts'"
+        ).fetchone() is not None
+        
+        # Trigrams match any substring, so the index narrows the same LIKE
+        # searches it replaced rather than changing their results
+        try:
+            self.db_connection.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS sources_fts USING fts5(
+                    title, content, content='sources', content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"FTS5 unavailable, falling back to LIKE search: {str(e)}")
+            return
+        
+        self.db_connection.executescript("""
+            CREATE TRIGGER IF NOT EXISTS sources_fts_ai AFTER INSERT ON sources BEGIN
+                INSERT INTO sources_fts(rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS sources_fts_ad AFTER DELETE ON sources BEGIN
+                INSERT INTO sources_fts(sources_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS sources_fts_au AFTER UPDATE OF title, content ON sources BEGIN
+                INSERT INTO sources_fts(sources_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+                INSERT INTO sources_fts(rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END;
+        """)
+        
+        # Index rows stored before the FTS table existed
+        if not fts_exists:
+            self.db_connection.execute("INSERT INTO sources_fts(sources_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+    
+    def _checkpoint_loop(self):
+        """Periodically truncate the WAL using a dedicated connection."""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            while not self._checkpoint_stop.wait(self.wal_checkpoint_interval):
+                try:
+                    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error as e:
+                    self.logger.warning(f"WAL checkpoint failed: {str(e)}")
+        finally:
+            connection.close()
+    
+    def close(self):
+        """Stop background threads and close all database connections."""
+        self._checkpoint_stop.set()
+        if self._checkpoint_thread is not None:
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+        
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown(wait=True)
+            self._hash_pool = None
+        
+        if self.db_connection is not None:
+            try:
+                self.db_connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.warning(f"PRAGMA optimize failed: {str(e)}")
+        with self._reader_lock:
+            for connection in self._reader_connections:
+                connection.close()
+            self._reader_connections.clear()
+        
+        if self.db_connection is not None:
+            self.db_connection.close()
+            self.db_connection = None
+    
+    def _analyze(self):
+        """Gather index statistics for the query planner."""
+        self.db_connection.execute("ANALYZE")
+        self.db_connection.commit()
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        """Return the calling reader thread's connection, opening it on first use."""
+        if self._readers is self._writer:
+            return self.db_connection
+        
+        connection = getattr(self._reader_local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+            )
+            connection.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                connection.execute(pragma)
+            self._reader_local.connection = connection
+            with self._reader_lock:
+                self._reader_connections.append(connection)
+        return connection
+    
+    async def _run_read(self, func, *args):
+        """Run a blocking read on the reader pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._readers, func, *args)
+    
+    async def _run_write(self, func, *args):
+        """Run a blocking write on the writer thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+    
+    def _fetch_one(self, sql: str, params=()):
+        """Execute a read query and return its first row."""
+        return self._read_connection().execute(sql, params).fetchone()
+    
+    def _source_cursor(self, sql: str, params=()) -> sqlite3.Cursor:
+        """Execute a _SOURCE_COLUMNS query on a cursor yielding plain tuples."""
+        cursor = self._read_connection().cursor()
+        # Positional rows skip sqlite3.Row's name lookups
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+    
+    def _fetch_source_dicts(self, sql: str, params=()) -> List[Dict[str, Any]]:
+        """Execute a source query, converting rows to dicts as the cursor yields them."""
+        return [self._row_to_dict(row) for row in self._source_cursor(sql, params)]
+    
     async def process(self, message: AgentMessage) -> AgentMessage:
         """
         Process source management requests.
@@ -210,38 +740,89 @@ class SourceManager(BaseAgent):
         """
         added_sources = []
         duplicates = []
-        errors = []
         
-        for source_data in sources_data:
-            try:
-                # Create Source object
-                source = Source(
-                    id=source_data.get("id", ""),
-                    url=source_data.get("url", ""),
-                    title=source_data.get("title", ""),
-                    content=source_data.get("content", ""),
-                    domain=self.extract_domain(source_data.get("url", "")),
-                    author=source_data.get("author"),
-                    publish_date=source_data.get("publish_date"),
-                    credibility_score=source_data.get("credibility_score", 0.5),
-                    tags=source_data.get("tags", []),
-                    metadata=source_data.get("metadata", {})
-                )
-                
-                # Check for duplicates
-                if await self.is_duplicate(source):
-                    duplicates.append(source.id)
+        # Go straight to insert rows; bulk adds never need Source objects.
+        # Hashing and title signatures run in one worker-thread job so large
+        # batches don't block the loop.
+        rows, signatures, tags_by_id, errors = await asyncio.to_thread(self._bulk_prepare, sources_data)
+        ID, URL, TITLE, CONTENT_HASH = self._ROW_ID, self._ROW_URL, self._ROW_TITLE, self._ROW_CONTENT_HASH
+        
+        # The probe and the insert run under one lock; otherwise two batches
+        # with the same URL could both miss each other and both insert
+        async with self._ingest_lock:
+            # One lookup for URL/content-hash duplicates instead of queries per
+            # source; only keys the Bloom filter may have seen need confirming
+            seen_urls, seen_hashes = await self._run_read(
+                self._fetch_existing_keys,
+                [row[URL] for row in rows if row[URL] in self._key_filter],
+                [row[CONTENT_HASH] for row in rows if row[CONTENT_HASH] in self._key_filter]
+            )
+            
+            # Fetch every stored title the LSH index proposes as a near-duplicate
+            candidate_ids: Set[str] = set()
+            for signature in signatures:
+                candidate_ids.update(self._title_lsh.query(signature))
+            titles_by_id = await self._run_read(self._load_titles, list(candidate_ids))
+            
+            # Derived IDs only repeat for a repeated URL, which is a duplicate;
+            # a caller-supplied ID can name a stored source the upsert then
+            # overwrites, so its old title signature has to leave the index
+            supplied_ids = [
+                source_data["id"] for source_data in sources_data
+                if isinstance(source_data, dict) and source_data.get("id")
+            ]
+            replaced_signatures = (
+                await self._run_read(self._load_signatures, supplied_ids) if supplied_ids else {}
+            )
+            
+            # Accepted sources join the title index right away so later sources in
+            # the same batch are checked against them
+            to_insert = []
+            inserted_signatures = []
+            for row, signature in zip(rows, signatures):
+                if (row[URL] in seen_urls or row[CONTENT_HASH] in seen_hashes
+                        or self._find_similar_title(row[TITLE], signature, titles_by_id)):
+                    duplicates.append(row[ID])
                     continue
                 
-                # Add to database
-                await self._save_source_to_db(source)
-                added_sources.append(source.id)
-                
-                # Update cache
-                self._update_cache(source)
-                
-            except Exception as e:
-                errors.append(f"Error adding source {source_data.get('url', 'unknown')}: {str(e)}")
+                seen_urls[row[URL]] = row[ID]
+                seen_hashes[row[CONTENT_HASH]] = row[ID]
+                titles_by_id[row[ID]] = row[TITLE]
+                if row[ID] in replaced_signatures:
+                    self._title_lsh.remove(row[ID], replaced_signatures[row[ID]])
+                self._title_lsh.insert(row[ID], signature)
+                to_insert.append(row)
+                inserted_signatures.append(signature)
+            
+            # Insert the whole batch in a single transaction; if it fails, retry row
+            # by row so one bad source doesn't reject the rest
+            try:
+                await self._run_write(self._save_sources_to_db, to_insert, tags_by_id)
+                saved = to_insert
+            except Exception:
+                saved = []
+                for row, signature in zip(to_insert, inserted_signatures):
+                    try:
+                        await self._run_write(self._save_sources_to_db, [row], tags_by_id)
+                        saved.append(row)
+                    except Exception as e:
+                        self._title_lsh.remove(row[ID], signature)
+                        if row[ID] in replaced_signatures:
+                            self._title_lsh.insert(row[ID], replaced_signatures[row[ID]])
+                        errors.append(f"Error adding source {row[URL] or 'unknown'}: {str(e)}")
+            
+            for row in saved:
+                if row[ID] in replaced_signatures:
+                    # The cached copy still holds the overwritten row
+                    with self._cache_lock:
+                        self.source_cache.pop(row[ID], None)
+                added_sources.append(row[ID])
+                self._key_filter.add(row[URL])
+                self._key_filter.add(row[CONTENT_HASH])
+        
+        # Refresh planner statistics after bulk loads so the composite indexes get used
+        if len(saved) >= self.analyze_batch_size:
+            await self._run_write(self._analyze)
         
         return AgentMessage.create(
             role="assistant",
@@ -272,10 +853,9 @@ class SourceManager(BaseAgent):
         """
         try:
             # Check cache first
-            if source_id in self.source_cache:
-                source = self.source_cache[source_id]
-            else:
-                source = await self._load_source_from_db(source_id)
+            source = self._get_cached(source_id)
+            if source is None:
+                source = await self._run_read(self._load_source_from_db, source_id)
                 if source:
                     self._update_cache(source)
             
@@ -293,7 +873,7 @@ class SourceManager(BaseAgent):
                 role="assistant",
                 content={
                     "status": "success",
-                    "source": source.__dict__
+                    "source": source
                 },
                 metadata={"agent": self.name}
             )
@@ -319,64 +899,37 @@ class SourceManager(BaseAgent):
             AgentMessage with search results
         """
         try:
-            # Build SQL query
-            sql = "SELECT * FROM sources WHERE 1=1"
+            # The SQL depends only on which filters are present, so it is built
+            # once per combination. Text filters keep their LIKE test; when
+            # available the FTS index first narrows the rows it has to check.
+            filter_keys = tuple(key for key in _SEARCH_CLAUSES if query.get(key))
             params = []
+            fts_terms = []
+            for key in filter_keys:
+                value = query[key]
+                if key == "tags":
+                    params.extend(value)
+                elif key in _LIKE_FILTERS:
+                    params.append(f"%{value}%")
+                    phrase = _fts_substring(value) if self.fts_enabled and key in _FTS_FILTERS else None
+                    if phrase is not None:
+                        fts_terms.append(f"{key} : {phrase}")
+                else:
+                    params.append(value)
+            if fts_terms:
+                params.append(" AND ".join(fts_terms))
             
-            # URL filter
-            if query.get("url"):
-                sql += " AND url LIKE ?"
-                params.append(f"%{query['url']}%")
-            
-            # Domain filter
-            if query.get("domain"):
-                sql += " AND domain = ?"
-                params.append(query["domain"])
-            
-            # Title filter
-            if query.get("title"):
-                sql += " AND title LIKE ?"
-                params.append(f"%{query['title']}%")
-            
-            # Content filter
-            if query.get("content"):
-                sql += " AND content LIKE ?"
-                params.append(f"%{query['content']}%")
-            
-            # Tags filter
-            if query.get("tags"):
-                for tag in query["tags"]:
-                    sql += " AND tags LIKE ?"
-                    params.append(f"%{tag}%")
-            
-            # Credibility score filter
-            if query.get("min_credibility"):
-                sql += " AND credibility_score >= ?"
-                params.append(query["min_credibility"])
-            
-            # Date range filter
-            if query.get("date_from"):
-                sql += " AND publish_date >= ?"
-                params.append(query["date_from"])
-            
-            if query.get("date_to"):
-                sql += " AND publish_date <= ?"
-                params.append(query["date_to"])
-            
-            # Limit and offset
-            limit = query.get("limit", 50)
+            # Limit and offset; the limit is capped so one query can't pull the whole table
+            limit = min(int(query.get("limit", 50)), self.max_search_limit)
             offset = query.get("offset", 0)
-            sql += f" ORDER BY last_accessed DESC LIMIT {limit} OFFSET {offset}"
+            params.extend((limit, int(offset)))
             
-            # Execute query
-            cursor = self.db_connection.execute(sql, params)
-            rows = cursor.fetchall()
+            sql = _build_search_sql(
+                filter_keys, len(query["tags"]) if "tags" in filter_keys else 0, bool(fts_terms)
+            )
             
-            # Convert to Source objects
-            sources = []
-            for row in rows:
-                source = self._row_to_source(row)
-                sources.append(source.__dict__)
+            # Execute query
+            sources = await self._run_read(self._fetch_source_dicts, sql, params)
             
             return AgentMessage.create(
                 role="assistant",
@@ -422,27 +975,13 @@ class SourceManager(BaseAgent):
             )
             
             # Save to database
-            self.db_connection.execute("""
-                INSERT OR REPLACE INTO collections 
-                (id, name, description, sources, created_date, last_updated, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                collection.id,
-                collection.name,
-                collection.description,
-                json.dumps(collection.sources),
-                collection.created_date,
-                collection.last_updated,
-                json.dumps(collection.metadata)
-            ))
-            
-            self.db_connection.commit()
+            await self._run_write(self._save_collection_to_db, collection)
             
             return AgentMessage.create(
                 role="assistant",
                 content={
                     "status": "success",
-                    "collection": collection.__dict__
+                    "collection": asdict(collection)
                 },
                 metadata={"agent": self.name}
             )
@@ -468,11 +1007,11 @@ class SourceManager(BaseAgent):
             AgentMessage with collection data
         """
         try:
-            cursor = self.db_connection.execute(
-                "SELECT * FROM collections WHERE id = ?",
+            row = await self._run_read(
+                self._fetch_one,
+                self._SQL_GET_COLLECTION,
                 (collection_id,)
             )
-            row = cursor.fetchone()
             
             if not row:
                 return AgentMessage.create(
@@ -488,10 +1027,10 @@ class SourceManager(BaseAgent):
                 "id": row["id"],
                 "name": row["name"],
                 "description": row["description"],
-                "sources": json.loads(row["sources"]),
+                "sources": orjson.loads(row["sources"]),
                 "created_date": row["created_date"],
                 "last_updated": row["last_updated"],
-                "metadata": json.loads(row["metadata"])
+                "metadata": orjson.loads(row["metadata"])
             }
             
             return AgentMessage.create(
@@ -535,10 +1074,10 @@ class SourceManager(BaseAgent):
                     params.append(value)
                 elif field == "tags":
                     set_clauses.append("tags = ?")
-                    params.append(json.dumps(value))
+                    params.append(_encode_tags(value))
                 elif field == "metadata":
                     set_clauses.append("metadata = ?")
-                    params.append(json.dumps(value))
+                    params.append(_json_blob(value))
             
             if not set_clauses:
                 return AgentMessage.create(
@@ -555,11 +1094,27 @@ class SourceManager(BaseAgent):
             params.append(datetime.now().isoformat())
             params.append(source_id)
             
+            # Keep the stored content hash and title signature in step with the
+            # fields they are derived from
+            new_content_hash = None
+            if "content" in updates:
+                new_content_hash = _content_hash(updates["content"] or "")
+                set_clauses.insert(0, "content_hash = ?")
+                params.insert(0, new_content_hash)
+            
+            new_signature = None
+            if "title" in updates:
+                new_signature = self._title_lsh.signature(updates["title"] or "")
+                set_clauses.insert(0, "minhash = ?")
+                params.insert(0, new_signature.tobytes() if new_signature is not None else None)
+            
             # Execute update
             sql = f"UPDATE sources SET {', '.join(set_clauses)} WHERE id = ?"
-            cursor = self.db_connection.execute(sql, params)
+            rowcount, old_blob = await self._run_write(
+                self._update_source_row, source_id, sql, params, updates.get("tags")
+            )
             
-            if cursor.rowcount == 0:
+            if rowcount == 0:
                 return AgentMessage.create(
                     role="assistant",
                     content={
@@ -569,15 +1124,21 @@ class SourceManager(BaseAgent):
                     metadata={"agent": self.name}
                 )
             
-            self.db_connection.commit()
+            if "title" in updates:
+                self._title_lsh.remove(source_id, _signature_from_blob(old_blob))
+                self._title_lsh.insert(source_id, new_signature)
+            if new_content_hash is not None:
+                self._key_filter.add(new_content_hash)
             
             # Update cache
-            if source_id in self.source_cache:
-                cached_source = self.source_cache[source_id]
+            cached_source = self._get_cached(source_id)
+            if cached_source is not None:
                 for field, value in updates.items():
-                    if hasattr(cached_source, field):
-                        setattr(cached_source, field, value)
-                cached_source.last_accessed = datetime.now().isoformat()
+                    if field in cached_source:
+                        cached_source[field] = value
+                if new_content_hash is not None:
+                    cached_source["content_hash"] = new_content_hash
+                cached_source["last_accessed"] = datetime.now().isoformat()
             
             return AgentMessage.create(
                 role="assistant",
@@ -609,13 +1170,10 @@ class SourceManager(BaseAgent):
             AgentMessage with deletion results
         """
         try:
-            # Delete from database
-            cursor = self.db_connection.execute(
-                "DELETE FROM sources WHERE id = ?",
-                (source_id,)
-            )
+            # Delete the source and its relations
+            rowcount, old_blob = await self._run_write(self._delete_source_rows, source_id)
             
-            if cursor.rowcount == 0:
+            if rowcount == 0:
                 return AgentMessage.create(
                     role="assistant",
                     content={
@@ -625,17 +1183,11 @@ class SourceManager(BaseAgent):
                     metadata={"agent": self.name}
                 )
             
-            # Delete from relations
-            self.db_connection.execute(
-                "DELETE FROM source_relations WHERE source_id1 = ? OR source_id2 = ?",
-                (source_id, source_id)
-            )
-            
-            self.db_connection.commit()
+            self._title_lsh.remove(source_id, _signature_from_blob(old_blob))
             
             # Remove from cache
-            if source_id in self.source_cache:
-                del self.source_cache[source_id]
+            with self._cache_lock:
+                self.source_cache.pop(source_id, None)
             
             return AgentMessage.create(
                 role="assistant",
@@ -670,20 +1222,36 @@ class SourceManager(BaseAgent):
             duplicates = []
             unique_sources = []
             
-            for source_data in sources:
-                source = Source(
-                    url=source_data.get("url", ""),
-                    title=source_data.get("title", ""),
-                    content=source_data.get("content", ""),
-                    domain=self.extract_domain(source_data.get("url", ""))
+            urls = [source_data.get("url", "") for source_data in sources]
+            titles = [source_data.get("title", "") for source_data in sources]
+            # Hashes and title signatures are pure CPU work; one worker-thread
+            # job computes both off the event loop
+            hashes, signatures = await asyncio.to_thread(self._hash_and_sign, sources, titles)
+            
+            # One query for URL/content-hash matches, limited to keys the Bloom
+            # filter may have seen, and one for near-duplicate title candidates
+            url_ids, hash_ids = await self._run_read(
+                self._fetch_existing_keys,
+                [url for url in urls if url in self._key_filter],
+                [h for h in hashes if h is not None and h in self._key_filter]
+            )
+            candidate_ids: Set[str] = set()
+            for signature in signatures:
+                candidate_ids.update(self._title_lsh.query(signature))
+            titles_by_id = await self._run_read(self._load_titles, list(candidate_ids))
+            
+            for source_data, url, title, content_hash, signature in zip(
+                    sources, urls, titles, hashes, signatures):
+                duplicate_of = (
+                    url_ids.get(url)
+                    or hash_ids.get(content_hash)
+                    or self._find_similar_title(title, signature, titles_by_id)
                 )
-                
-                # Check if duplicate exists
-                if await self.is_duplicate(source):
+                if duplicate_of is not None:
                     duplicates.append({
-                        "url": source.url,
-                        "title": source.title,
-                        "duplicate_of": await self.find_duplicate_match(source)
+                        "url": url,
+                        "title": title,
+                        "duplicate_of": duplicate_of
                     })
                 else:
                     unique_sources.append(source_data)
@@ -720,26 +1288,8 @@ class SourceManager(BaseAgent):
             AgentMessage with statistics
         """
         try:
-            # Source statistics
-            cursor = self.db_connection.execute("SELECT COUNT(*) FROM sources")
-            total_sources = cursor.fetchone()[0]
-            
-            cursor = self.db_connection.execute("SELECT COUNT(DISTINCT domain) FROM sources")
-            unique_domains = cursor.fetchone()[0]
-            
-            cursor = self.db_connection.execute("SELECT AVG(credibility_score) FROM sources")
-            avg_credibility = cursor.fetchone()[0] or 0
-            
-            # Collection statistics
-            cursor = self.db_connection.execute("SELECT COUNT(*) FROM collections")
-            total_collections = cursor.fetchone()[0]
-            
-            # Recent activity
-            cursor = self.db_connection.execute("""
-                SELECT COUNT(*) FROM sources 
-                WHERE last_accessed > datetime('now', '-7 days')
-            """)
-            recent_access = cursor.fetchone()[0]
+            (total_sources, unique_domains, avg_credibility,
+             total_collections, recent_access) = await self._run_read(self._query_statistics)
             
             return AgentMessage.create(
                 role="assistant",
@@ -769,67 +1319,60 @@ class SourceManager(BaseAgent):
     
     # Helper methods
     
+    def _query_statistics(self) -> tuple:
+        """Run the statistics queries on one reader connection."""
+        connection = self._read_connection()
+        
+        # Source statistics
+        total_sources = connection.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        unique_domains = connection.execute("SELECT COUNT(DISTINCT domain) FROM sources").fetchone()[0]
+        avg_credibility = connection.execute("SELECT AVG(credibility_score) FROM sources").fetchone()[0] or 0
+        
+        # Collection statistics
+        total_collections = connection.execute("SELECT COUNT(*) FROM collections").fetchone()[0]
+        
+        # Recent activity
+        recent_access = connection.execute("""
+            SELECT COUNT(*) FROM sources 
+            WHERE last_accessed > datetime('now', '-7 days')
+        """).fetchone()[0]
+        
+        return total_sources, unique_domains, avg_credibility, total_collections, recent_access
+    
     def extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain
-        except:
-            return "unknown"
+        return _extract_domain(url)
     
     async def is_duplicate(self, source: Source) -> bool:
         """Check if a source is a duplicate."""
-        # Check by URL
-        cursor = self.db_connection.execute(
-            "SELECT id FROM sources WHERE url = ?",
-            (source.url,)
-        )
-        if cursor.fetchone():
-            return True
-        
-        # Check by content hash
-        content_hash = hashlib.md5(source.content.encode()).hexdigest()
-        cursor = self.db_connection.execute(
-            "SELECT id FROM sources WHERE content_hash = ?",
-            (content_hash,)
-        )
-        if cursor.fetchone():
-            return True
+        # Check by URL; the Bloom filter rules out unseen URLs without a query
+        if source.url in self._key_filter:
+            if await self._run_read(self._fetch_one, self._SQL_DUP_URL, (source.url,)):
+                return True
         
-        # Check by title similarity (simplified)
-        cursor = self.db_connection.execute(
-            "SELECT id, title FROM sources WHERE title LIKE ?",
-            (f"%{source.title[:50]}%",)
-        )
-        rows = cursor.fetchall()
-        for row in rows:
-            similarity = self.calculate_similarity(source.title, row["title"])
-            if similarity > self.duplicate_threshold:
+        # Check by content hash, computed once when the Source was built
+        if source.content_hash in self._key_filter:
+            if await self._run_read(
+                self._fetch_one, self._SQL_DUP_HASH, (source.content_hash,)
+            ):
                 return True
         
-        return False
+        # Check by title similarity (MinHash LSH candidates, verified exactly)
+        signature = self._title_lsh.signature(source.title)
+        titles_by_id = await self._run_read(self._load_titles, list(self._title_lsh.query(signature)))
+        return self._find_similar_title(source.title, signature, titles_by_id) is not None
     
     async def find_duplicate_match(self, source: Source) -> Optional[str]:
         """Find the ID of the duplicate source."""
         # Check by URL
-        cursor = self.db_connection.execute(
-            "SELECT id FROM sources WHERE url = ?",
-            (source.url,)
-        )
-        row = cursor.fetchone()
+        row = await self._run_read(self._fetch_one, self._SQL_DUP_URL, (source.url,))
         if row:
             return row["id"]
         
         # Check by content hash
-        content_hash = hashlib.md5(source.content.encode()).hexdigest()
-        cursor = self.db_connection.execute(
-            "SELECT id FROM sources WHERE content_hash = ?",
-            (content_hash,)
+        row = await self._run_read(
+            self._fetch_one, self._SQL_DUP_HASH, (source.content_hash,)
         )
-        row = cursor.fetchone()
         if row:
             return row["id"]
         
@@ -847,71 +1390,267 @@ class SourceManager(BaseAgent):
     
     def generate_collection_id(self) -> str:
         """Generate unique collection ID."""
-        return f"collection_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hashlib.md5(datetime.now().isoformat().encode()).hexdigest()[:8]}"
-    
-    async def _save_source_to_db(self, source: Source):
-        """Save source to database."""
-        content_hash = hashlib.md5(source.content.encode()).hexdigest()
-        
-        self.db_connection.execute("""
-            INSERT OR REPLACE INTO sources 
-            (id, url, title, content, domain, author, publish_date, last_accessed, 
-             credibility_score, tags, metadata, content_hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            source.id,
-            source.url,
-            source.title,
-            source.content,
-            source.domain,
-            source.author,
-            source.publish_date,
-            source.last_accessed,
-            source.credibility_score,
-            json.dumps(source.tags),
-            json.dumps(source.metadata),
-            content_hash
-        ))
-        
-        self.db_connection.commit()
+        return f"collection_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hashlib.blake2b(datetime.now().isoformat().encode(), digest_size=4).hexdigest()}"
     
-    async def _load_source_from_db(self, source_id: str) -> Optional[Source]:
-        """Load source from database."""
-        cursor = self.db_connection.execute(
-            "SELECT * FROM sources WHERE id = ?",
-            (source_id,)
+    def _fetch_existing_keys(self, urls: List[str], content_hashes: List[str]) -> tuple:
+        """Map those of the given URLs and content hashes already stored to their source IDs."""
+        existing_urls: Dict[str, str] = {}
+        existing_hashes: Dict[str, str] = {}
+        connection = self._read_connection()
+        
+        # Stay well below SQLite's bound-parameter limit
+        chunk_size = 450
+        for start in range(0, max(len(urls), len(content_hashes)), chunk_size):
+            url_chunk = urls[start:start + chunk_size]
+            hash_chunk = content_hashes[start:start + chunk_size]
+            cursor = connection.execute(
+                f"SELECT id, url, content_hash FROM sources "
+                f"WHERE url IN ({', '.join('?' * len(url_chunk))}) "
+                f"OR content_hash IN ({', '.join('?' * len(hash_chunk))})",
+                (*url_chunk, *hash_chunk)
+            )
+            for row in cursor:
+                existing_urls.setdefault(row["url"], row["id"])
+                existing_hashes.setdefault(row["content_hash"], row["id"])
+        
+        # A row matched on one key may carry the other key unrequested
+        wanted_urls, wanted_hashes = set(urls), set(content_hashes)
+        return (
+            {url: source_id for url, source_id in existing_urls.items() if url in wanted_urls},
+            {h: source_id for h, source_id in existing_hashes.items() if h in wanted_hashes}
         )
-        row = cursor.fetchone()
+    
+    def _load_titles(self, source_ids: List[str]) -> Dict[str, str]:
+        """Load stored titles for the given source IDs."""
+        connection = self._read_connection()
+        titles: Dict[str, str] = {}
+        for start in range(0, len(source_ids), 900):
+            chunk = source_ids[start:start + 900]
+            cursor = connection.execute(
+                f"SELECT id, title FROM sources WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            titles.update((row["id"], row["title"]) for row in cursor)
+        return titles
+    
+    def _load_signatures(self, source_ids: List[str]) -> Dict[str, Optional[array]]:
+        """Load stored title signatures for those of the given source IDs that exist."""
+        connection = self._read_connection()
+        signatures: Dict[str, Optional[array]] = {}
+        for start in range(0, len(source_ids), 900):
+            chunk = source_ids[start:start + 900]
+            cursor = connection.execute(
+                f"SELECT id, minhash FROM sources WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            signatures.update((row["id"], _signature_from_blob(row["minhash"])) for row in cursor)
+        return signatures
+    
+    def _find_similar_title(self, title: str, signature: Optional[array],
+                            titles_by_id: Dict[str, str]) -> Optional[str]:
+        """
+        Find a stored or pending title above the duplicate threshold.
+        
+        Args:
+            title: Title to check
+            signature: Its MinHash signature
+            titles_by_id: Titles of the LSH candidates, by source ID
+            
+        Returns:
+            ID of a near-duplicate source, or None
+        """
+        for candidate_id in self._title_lsh.query(signature):
+            candidate = titles_by_id.get(candidate_id)
+            if candidate is not None and self.calculate_similarity(title, candidate) > self.duplicate_threshold:
+                return candidate_id
+        return None
+    
+    def _bulk_prepare(self, sources_data: List[Dict[str, Any]]) -> tuple:
+        """
+        Turn source dictionaries into _SQL_INSERT_SOURCE rows without building Source objects.
+        
+        Args:
+            sources_data: List of source dictionaries
+            
+        Returns:
+            Tuple of (rows, title signatures, tags by source ID, error messages);
+            rows and signatures line up index for index
+        """
+        rows = []
+        signatures = []
+        tags_by_id: Dict[str, List[str]] = {}
+        errors = []
+        content_hashes = self._hash_batch(sources_data)
+        for source_data, content_hash in zip(sources_data, content_hashes):
+            try:
+                url = source_data.get("url", "")
+                title = source_data.get("title", "")
+                content = source_data.get("content", "")
+                tags = source_data.get("tags", [])
+                source_id = source_data.get("id") or _source_id(url, title, content)
+                signature = self._title_lsh.signature(title)
+                rows.append((
+                    source_id,
+                    url,
+                    title,
+                    content,
+                    self.extract_domain(url),
+                    source_data.get("author"),
+                    source_data.get("publish_date"),
+                    datetime.now().isoformat(),
+                    source_data.get("credibility_score", 0.5),
+                    _encode_tags(tags),
+                    _json_blob(source_data.get("metadata", {})),
+                    content_hash or _content_hash(content),
+                    signature.tobytes() if signature is not None else None
+                ))
+                signatures.append(signature)
+                tags_by_id[source_id] = tags
+            except Exception as e:
+                errors.append(f"Error adding source {source_data.get('url', 'unknown')}: {str(e)}")
+        return rows, signatures, tags_by_id, errors
+    
+    def _hash_batch(self, sources_data: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Hash the content of a batch, in parallel when the batch is large.
+        
+        A source dict may carry the content_hash its producer already computed
+        (as Source does); a SHA-256 hex digest is used instead of hashing
+        again, anything else is recomputed from the content.
+        
+        Args:
+            sources_data: List of source dictionaries
+            
+        Returns:
+            Content hashes in input order; None where the content could not
+            be read, leaving the error to the caller
+        """
+        hashes: List[Optional[str]] = [None] * len(sources_data)
+        pending = []
+        for i, source_data in enumerate(sources_data):
+            if not isinstance(source_data, dict):
+                continue
+            supplied = source_data.get("content_hash")
+            if isinstance(supplied, str) and _CONTENT_HASH_RE.fullmatch(supplied):
+                hashes[i] = supplied
+                continue
+            content = source_data.get("content", "")
+            if isinstance(content, str):
+                pending.append((i, content))
+        
+        total_bytes = sum(len(content) for _, content in pending)
+        if total_bytes < self.parallel_hash_bytes or self.hash_workers < 2:
+            for i, content in pending:
+                hashes[i] = _content_hash(content)
+            return hashes
+        
+        if self._hash_pool is None:
+            self._hash_pool = ThreadPoolExecutor(
+                max_workers=self.hash_workers, thread_name_prefix="SourceManager-hash"
+            )
+        for (i, _), content_hash in zip(pending, self._hash_pool.map(_content_hash, [c for _, c in pending])):
+            hashes[i] = content_hash
+        return hashes
+    
+    def _hash_and_sign(self, sources_data: List[Dict[str, Any]], titles: List[str]) -> tuple:
+        """Compute content hashes and title signatures for a batch, in input order."""
+        return self._hash_batch(sources_data), [self._title_lsh.signature(title) for title in titles]
+    
+    def _save_sources_to_db(self, rows: List[tuple], tags_by_id: Dict[str, List[str]]):
+        """Save _SQL_INSERT_SOURCE rows and their tags to the database in one transaction."""
+        if not rows:
+            return
+        
+        with self.db_connection:
+            source_ids = [(row[self._ROW_ID],) for row in rows]
+            self.db_connection.executemany(self._SQL_INSERT_SOURCE, rows)
+            # The upsert may have updated an existing source; drop its old tags
+            self.db_connection.executemany(self._SQL_DELETE_TAGS, source_ids)
+            self.db_connection.executemany(self._SQL_INSERT_TAG, [
+                (source_id, tag)
+                for (source_id,) in source_ids
+                for tag in tags_by_id.get(source_id, ())
+            ])
+    
+    def _save_collection_to_db(self, collection: SourceCollection):
+        """Save a collection to the database."""
+        with self.db_connection:
+            self.db_connection.execute(self._SQL_UPSERT_COLLECTION, (
+                collection.id,
+                collection.name,
+                collection.description,
+                _json_blob(collection.sources),
+                collection.created_date,
+                collection.last_updated,
+                _json_blob(collection.metadata)
+            ))
+    
+    def _update_source_row(self, source_id: str, sql: str, params: List[Any],
+                           tags: Optional[List[str]] = None) -> tuple:
+        """Apply an UPDATE to a source, returning the row count and its previous title signature."""
+        with self.db_connection:
+            row = self.db_connection.execute(
+                self._SQL_GET_MINHASH, (source_id,)
+            ).fetchone()
+            cursor = self.db_connection.execute(sql, params)
+            if cursor.rowcount and tags is not None:
+                self.db_connection.execute(self._SQL_DELETE_TAGS, (source_id,))
+                self.db_connection.executemany(self._SQL_INSERT_TAG, [(source_id, tag) for tag in tags])
+        return cursor.rowcount, row["minhash"] if row else None
+    
+    def _delete_source_rows(self, source_id: str) -> tuple:
+        """Delete a source and its relations, returning the row count and its title signature."""
+        with self.db_connection:
+            row = self.db_connection.execute(
+                self._SQL_GET_MINHASH, (source_id,)
+            ).fetchone()
+            cursor = self.db_connection.execute(self._SQL_DELETE_SOURCE, (source_id,))
+            if cursor.rowcount:
+                self.db_connection.execute(self._SQL_DELETE_RELATIONS, (source_id, source_id))
+                self.db_connection.execute(self._SQL_DELETE_TAGS, (source_id,))
+        return cursor.rowcount, row["minhash"] if row else None
+    
+    def _load_source_from_db(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """Load a source dict from the database."""
+        row = self._source_cursor(self._SQL_GET_SOURCE, (source_id,)).fetchone()
         
         if row:
-            return self._row_to_source(row)
+            return self._row_to_dict(row)
         
         return None
     
-    def _row_to_source(self, row) -> Source:
-        """Convert database row to Source object."""
-        return Source(
-            id=row["id"],
-            url=row["url"],
-            title=row["title"],
-            content=row["content"],
-            domain=row["domain"],
-            author=row["author"],
-            publish_date=row["publish_date"],
-            last_accessed=row["last_accessed"],
-            credibility_score=row["credibility_score"],
-            tags=json.loads(row["tags"]) if row["tags"] else [],
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {}
-        )
+    def _row_to_dict(self, row: tuple) -> Dict[str, Any]:
+        """Convert a positional _SOURCE_COLUMNS row to a source dict with the same keys as Source."""
+        (source_id, url, title, content, domain, author, publish_date,
+         last_accessed, credibility_score, tags, metadata, content_hash) = row
+        return {
+            "id": source_id,
+            "url": url,
+            "title": title,
+            "content": content,
+            "domain": domain,
+            "author": author,
+            "publish_date": publish_date,
+            "last_accessed": last_accessed,
+            "credibility_score": credibility_score,
+            "tags": orjson.loads(tags) if tags else [],
+            "metadata": orjson.loads(metadata) if metadata else {},
+            "content_hash": content_hash
+        }
     
-    def _update_cache(self, source: Source):
-        """Update source cache."""
-        if len(self.source_cache) >= self.cache_size_limit:
-            # Remove oldest entry
-            oldest_key = next(iter(self.source_cache))
-            del self.source_cache[oldest_key]
-        
-        self.source_cache[source.id] = source
+    def _get_cached(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached source and mark it most recently used."""
+        with self._cache_lock:
+            source = self.source_cache.get(source_id)
+            if source is not None:
+                self.source_cache.move_to_end(source_id)
+            return source
+    
+    def _update_cache(self, source: Dict[str, Any]):
+        """Update source cache, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            self.source_cache[source["id"]] = source
+            self.source_cache.move_to_end(source["id"])
+            while len(self.source_cache) > self.cache_size_limit:
+                self.source_cache.popitem(last=False)
 
 # Example usage
 async def test_source_manager():
@@ -977,8 +1716,12 @@ async def test_source_manager():
         search_content = search_result.content_dict
         sources_found = search_content.get("sources", [])
         print(f"   Found: {len(sources_found)} sources")
-        for source in sources_found:
-            print(f"   - {source.get('title', '')} (Credibility: {source.get('credibility_score', 0):.2f})")
+        # One write for the whole listing rather than a print per row
+        if sources_found:
+            print("\n".join(
+                f"   - {source['title']} (Credibility: {source['credibility_score']:.2f})"
+                for source in sources_found
+            ))
         
         # Test 3: Create collection
         print("\n3. Creating collection...")
@@ -1024,8 +1767,7 @@ async def test_source_manager():
         print(f"Error during testing: {str(e)}")
     finally:
         # Cleanup
-        if manager.db_connection:
-            manager.db_connection.close()
+        manager.close()
 
 if __name__ == "__main__":
     asyncio.run(test_source_manager())
@@ -112,7 +112,7 @@ class WebResearcher(BaseAgent):
                 content={
                     "status": "error",
                     "error": str(e),
-                    "query": message.content.get("query", ""),
+                    "query": message.content_dict.get("query", ""),
                     "results": []
                 },
                 metadata={"agent": self.name}
@@ -477,4 +477,9 @@ async def main():
     print("  4. Integrate with your applications")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # Fall back to the default event loop (e.g. on Windows)
     asyncio.run(main())
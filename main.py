@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 from typing import Dict, Any, Optional
 
 from agents.research_orchestrator import ResearchOrchestrator
-from utils.logger import ResearchLogger
+from utils.logger import get_logger
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +28,9 @@ DEFAULT_CONFIG = {
     "enable_academic_search": True,
     "min_verification_sources": 2,
     "timeout_seconds": 300,  # 5 minutes
+    "max_concurrent_sources": 5,  # Per-source tasks run at once during collection/analysis
+    "max_concurrency": 16,  # Source tasks in flight across all research phases
+    "phase_log_path": None,  # Optional JSONL file that phase records are appended to
 }
 
 class ResearchAssistant:
@@ -36,7 +39,7 @@ class ResearchAssistant:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the research assistant with configuration."""
         self.config = {**DEFAULT_CONFIG, **(config or {})}
-        self.logger = ResearchLogger()
+        self.logger = get_logger()
         self._validate_config()
         
         # Create output directories
@@ -69,7 +72,7 @@ class ResearchAssistant:
         Returns:
             Dict containing research results and metadata
         """
-        self.logger.info(f"Starting research on topic: {topic}")
+        self.logger.info("Starting research on topic: %s", topic)
         
         try:
             # Initialize the research orchestrator
@@ -81,7 +84,7 @@ class ResearchAssistant:
             # Save the final report
             output_file = self._save_report(report, topic)
             
-            self.logger.info(f"Research completed successfully. Report saved to: {output_file}")
+            self.logger.info("Research completed successfully. Report saved to: %s", output_file)
             
             return {
                 "status": "completed",
@@ -91,7 +94,7 @@ class ResearchAssistant:
             }
             
         except Exception as e:
-            self.logger.error(f"Research failed: {str(e)}")
+            self.logger.error("Research failed: %s", e)
             return {
                 "status": "failed",
                 "error": str(e),
@@ -165,4 +168,9 @@ async def main():
         print(f"\n❌ Research failed: {result.get('error', 'Unknown error')}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # Fall back to the default event loop (e.g. on Windows)
     asyncio.run(main())
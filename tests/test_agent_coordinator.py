@@ -0,0 +1,105 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.agent_coordinator import AgentCoordinator, AgentStatus
+from agents.base_agent import AgentMessage
+
+class WorkflowCacheTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the coordinator's workflow result cache and in-flight dedup."""
+    
+    def _coordinator(self, **config) -> AgentCoordinator:
+        coordinator = AgentCoordinator(config)
+        coordinator.runs = 0
+        
+        async def fake_workflow(topic, query, max_sources, output_format):
+            coordinator.runs += 1
+            await asyncio.sleep(0)
+            return [
+                {"step": "web_research", "status": AgentStatus.COMPLETED, "result": {"results": [{"url": topic}]}},
+                {"step": "output_generation", "status": AgentStatus.COMPLETED, "result": {"report": {"topic": topic}}},
+            ]
+        
+        coordinator.execute_workflow_collect = fake_workflow
+        return coordinator
+    
+    async def _run(self, coordinator: AgentCoordinator, topic: str):
+        response = await coordinator.process(AgentMessage.create(role="user", content={"topic": topic}))
+        self.assertEqual(response.content["status"], "success")
+        return response.content["results"]
+    
+    async def test_repeated_request_hits_cache(self):
+        coordinator = self._coordinator()
+        first = await self._run(coordinator, "solar energy")
+        second = await self._run(coordinator, "Solar Energy ")
+        
+        self.assertEqual(coordinator.runs, 1)
+        self.assertEqual(first, second)
+    
+    async def test_cached_results_are_isolated_from_callers(self):
+        coordinator = self._coordinator()
+        first = await self._run(coordinator, "solar energy")
+        first[0]["status"] = AgentStatus.ERROR
+        first[1]["result"]["report"]["topic"] = "tampered"
+        
+        second = await self._run(coordinator, "solar energy")
+        self.assertEqual(second[0]["status"], AgentStatus.COMPLETED)
+        self.assertEqual(second[1]["result"]["report"]["topic"], "solar energy")
+    
+    async def test_ttl_expiry_reruns_workflow(self):
+        coordinator = self._coordinator(workflow_cache_ttl=60)
+        with mock.patch("agents.agent_coordinator.time.monotonic", return_value=1000.0):
+            await self._run(coordinator, "solar energy")
+        with mock.patch("agents.agent_coordinator.time.monotonic", return_value=1059.0):
+            await self._run(coordinator, "solar energy")
+        self.assertEqual(coordinator.runs, 1)
+        
+        with mock.patch("agents.agent_coordinator.time.monotonic", return_value=1061.0):
+            await self._run(coordinator, "solar energy")
+        self.assertEqual(coordinator.runs, 2)
+    
+    async def test_cache_is_bounded_by_lru(self):
+        coordinator = self._coordinator(workflow_cache_size=2)
+        await self._run(coordinator, "a")
+        await self._run(coordinator, "b")
+        await self._run(coordinator, "a")  # "b" is now least recently used
+        await self._run(coordinator, "c")
+        self.assertEqual(coordinator.runs, 3)
+        self.assertEqual(len(coordinator._workflow_cache), 2)
+        
+        await self._run(coordinator, "a")
+        self.assertEqual(coordinator.runs, 3)
+        await self._run(coordinator, "b")
+        self.assertEqual(coordinator.runs, 4)
+    
+    async def test_concurrent_requests_share_one_run(self):
+        coordinator = self._coordinator()
+        results = await asyncio.gather(*(self._run(coordinator, "solar energy") for _ in range(3)))
+        
+        self.assertEqual(coordinator.runs, 1)
+        self.assertEqual(coordinator._inflight_workflows, {})
+        # Each waiter gets its own copy of the shared run's results
+        results[0][1]["result"]["report"]["topic"] = "tampered"
+        self.assertEqual(results[1][1]["result"]["report"]["topic"], "solar energy")
+        self.assertEqual(results[2][1]["result"]["report"]["topic"], "solar energy")
+    
+    async def test_failed_workflow_is_not_cached(self):
+        coordinator = AgentCoordinator({})
+        runs = []
+        
+        async def failing_workflow(topic, query, max_sources, output_format):
+            runs.append(topic)
+            return [{"step": "web_research", "status": AgentStatus.ERROR, "error": "offline"}]
+        
+        coordinator.execute_workflow_collect = failing_workflow
+        await self._run(coordinator, "solar energy")
+        await self._run(coordinator, "solar energy")
+        self.assertEqual(len(runs), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents import output_generator
+from agents.output_generator import OutputGenerator
+from agents.base_agent import AgentMessage
+
+SYNTHESIS = {
+    "topic": "Solar energy adoption",
+    "executive_summary": "Solar adoption keeps growing.",
+    "key_findings": [{"finding": "Costs fell", "confidence": 0.9, "sources": ["s1"]}],
+    "confidence_score": 0.8,
+    "source_count": 1,
+}
+
+class OutputFormatTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for single- and multi-format report generation."""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp(prefix="ara_test_")
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        self.generator = OutputGenerator({"output_dir": self.output_dir})
+    
+    async def asyncTearDown(self):
+        await self.generator.cleanup()
+    
+    async def _process(self, output_format):
+        message = AgentMessage.create(role="user", content={"synthesis": SYNTHESIS, "format": output_format})
+        return (await self.generator.process(message)).content_dict
+    
+    async def test_single_format_string(self):
+        result = await self._process("html")
+        
+        self.assertEqual(result["status"], "success")
+        self.assertNotIn("reports", result)
+        self.assertEqual(result["report"]["format"], "html")
+        self.assertTrue(os.path.exists(result["report"]["filepath"]))
+    
+    async def test_multiple_formats_share_one_html_render(self):
+        render = mock.AsyncMock(wraps=self.generator.generate_html_report)
+        with mock.patch.object(self.generator, "generate_html_report", render), \
+                mock.patch.object(output_generator, "WEASYPRINT_AVAILABLE", False):
+            result = await self._process(["html", "markdown", "pdf"])
+        
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(render.await_count, 1)
+        self.assertEqual([r["format"] for r in result["reports"]], ["html", "markdown", "pdf"])
+        self.assertEqual(result["report"], result["reports"][0])
+        
+        paths = {r["format"]: Path(r["filepath"]) for r in result["reports"]}
+        self.assertEqual(len(set(paths.values())), 3)
+        # Without weasyprint the PDF file holds the same HTML render
+        self.assertEqual(paths["pdf"].read_bytes(), paths["html"].read_bytes())
+        self.assertTrue(paths["markdown"].read_text(encoding="utf-8").startswith("# "))
+    
+    async def test_empty_format_list_is_rejected(self):
+        result = await self._process([])
+        
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error"], "No output format requested")
+        self.assertEqual(os.listdir(self.output_dir), [])
+    
+    async def test_unsupported_format_is_rejected_before_rendering(self):
+        result = await self._process(["html", "docx"])
+        
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["error"], "Unsupported output format: docx")
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.planner import ResearchPlanner, cached_llm
+
+class CountingPlanner(ResearchPlanner):
+    """Planner whose cached step counts how often it really runs."""
+    
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+    
+    @cached_llm
+    async def _step(self, topic, analysis=None):
+        self.calls += 1
+        return {"topic": topic, "analysis": analysis, "created_at": self._now_iso()}
+
+class PlannerCacheTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the planner's TTL/LRU cache of LLM-backed steps."""
+    
+    async def test_repeated_step_hits_cache(self):
+        planner = CountingPlanner({})
+        first = await planner._step("quantum computing", {"scope": "narrow"})
+        second = await planner._step("quantum computing", {"scope": "narrow"})
+        
+        self.assertEqual(planner.calls, 1)
+        self.assertEqual(first["analysis"], second["analysis"])
+        self.assertIsNot(first, second)
+    
+    async def test_non_topic_arguments_are_part_of_key(self):
+        planner = CountingPlanner({})
+        await planner._step("quantum computing", {"scope": "narrow"})
+        result = await planner._step("quantum computing", {"scope": "broad"})
+        
+        self.assertEqual(planner.calls, 2)
+        self.assertEqual(result["analysis"], {"scope": "broad"})
+    
+    async def test_input_timestamps_do_not_change_key(self):
+        planner = CountingPlanner({})
+        await planner._step("quantum computing", {"scope": "narrow", "analysis_timestamp": "t1"})
+        await planner._step("quantum computing", {"scope": "narrow", "analysis_timestamp": "t2"})
+        
+        self.assertEqual(planner.calls, 1)
+    
+    async def test_cache_hit_refreshes_timestamps(self):
+        planner = CountingPlanner({})
+        with mock.patch.object(planner, "_now_iso", return_value="2024-01-01T00:00:00+00:00"):
+            await planner._step("quantum computing")
+        with mock.patch.object(planner, "_now_iso", return_value="2024-01-01T00:05:00+00:00"):
+            result = await planner._step("quantum computing")
+        
+        self.assertEqual(planner.calls, 1)
+        self.assertEqual(result["created_at"], "2024-01-01T00:05:00+00:00")
+    
+    async def test_ttl_expiry_invalidates_entry(self):
+        planner = CountingPlanner({"llm_cache_ttl": 600})
+        with mock.patch("agents.planner.time.monotonic", return_value=1000.0):
+            await planner._step("quantum computing")
+        with mock.patch("agents.planner.time.monotonic", return_value=1500.0):
+            await planner._step("quantum computing")
+        self.assertEqual(planner.calls, 1)
+        
+        with mock.patch("agents.planner.time.monotonic", return_value=1601.0):
+            await planner._step("quantum computing")
+        self.assertEqual(planner.calls, 2)
+    
+    async def test_prompt_version_bump_invalidates_entry(self):
+        planner = CountingPlanner({"prompt_version": "v1"})
+        await planner._step("quantum computing")
+        planner.config["prompt_version"] = "v2"
+        await planner._step("quantum computing")
+        
+        self.assertEqual(planner.calls, 2)
+    
+    async def test_least_recently_used_entry_is_evicted(self):
+        planner = CountingPlanner({"llm_cache_size": 2})
+        await planner._step("a")
+        await planner._step("b")
+        await planner._step("a")  # "b" is now least recently used
+        await planner._step("c")
+        self.assertEqual(planner.calls, 3)
+        
+        await planner._step("a")
+        self.assertEqual(planner.calls, 3)
+        await planner._step("b")
+        self.assertEqual(planner.calls, 4)
+    
+    async def test_process_reuses_cached_steps(self):
+        planner = ResearchPlanner({})
+        first = await planner._analyze_topic("quantum computing")
+        questions = await planner._generate_sub_questions("quantum computing", first)
+        again = await planner._generate_sub_questions("quantum computing", await planner._analyze_topic("quantum computing"))
+        
+        self.assertEqual([q.question for q in questions], [q.question for q in again])
+        self.assertEqual(len(planner._llm_cache), 2)
+
+if __name__ == "__main__":
+    unittest.main()
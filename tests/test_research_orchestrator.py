@@ -0,0 +1,52 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.research_orchestrator import ResearchOrchestrator
+
+class GatherBoundedTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the orchestrator's bounded worker pool."""
+    
+    async def test_results_keep_submission_order(self):
+        orchestrator = ResearchOrchestrator("solar energy", {"max_concurrent_sources": 2})
+        
+        async def job(value):
+            await asyncio.sleep(0.01 * (5 - value))
+            return value
+        
+        results = await orchestrator._gather_bounded(job(i) for i in range(5))
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+    
+    async def test_failure_cancels_running_workers(self):
+        orchestrator = ResearchOrchestrator("solar energy", {"max_concurrent_sources": 3})
+        cancelled = []
+        started = []
+        
+        async def slow(index):
+            started.append(index)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+        
+        async def failing():
+            await asyncio.sleep(0)
+            raise ValueError("fetch failed")
+        
+        coros = [slow(0), failing(), slow(2), slow(3)]
+        with self.assertRaises(ValueError):
+            await orchestrator._gather_bounded(iter(coros))
+        
+        # Both in-flight jobs were cancelled before the error reached the
+        # caller, and the job that never started was closed, not left pending
+        self.assertEqual(sorted(cancelled), [0, 2])
+        self.assertEqual(sorted(started), [0, 2])
+        self.assertIsNone(coros[3].cr_frame)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.source_manager import SourceManager, _SCHEMA_VERSION, _content_hash
+
+SAMPLE_SOURCES = [
+    {"url": "https://example.com/enumerate", "title": "Enumerate numbers in Python",
+     "content": "A C++ templates guide, compared with Python.", "tags": ["python", "c++"]},
+    {"url": "https://example.org/numerical", "title": "Numerical methods",
+     "content": "c is fun, and so is Fortran.", "tags": ["math"]},
+    {"url": "https://example.net/cafe", "title": "Über café culture",
+     "content": "a_b testing is 100% sure to help.", "tags": ["culture"]},
+    {"url": "https://example.com/quantum", "title": "Quantum computing",
+     "content": "Python and c++ and rust all have \"quantum\" libraries.", "tags": ["physics"]},
+    {"url": "https://example.io/num", "title": "The NUM trick",
+     "content": "Nothing to see here.", "tags": []},
+]
+
+class SourceManagerTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for SourceManager deduplication, search, migration and caching."""
+    
+    def setUp(self):
+        self.managers = []
+    
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+    
+    def _manager(self, **config) -> SourceManager:
+        manager = SourceManager({"db_path": ":memory:", **config})
+        self.managers.append(manager)
+        return manager
+    
+    async def test_concurrent_add_sources_detects_duplicates(self):
+        manager = self._manager()
+        # Same URL, different title/content: distinct IDs, so only the
+        # duplicate check keeps a second copy out
+        batches = [
+            [{"url": "https://example.com/a", "title": f"Variant {i}", "content": f"Body {i}"}]
+            for i in range(5)
+        ]
+        results = await asyncio.gather(*(manager.add_sources(batch) for batch in batches))
+        
+        self.assertEqual(sum(r.content["added"] for r in results), 1)
+        self.assertEqual(sum(r.content["duplicates"] for r in results), 4)
+        count = manager.db_connection.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        self.assertEqual(count, 1)
+    
+    async def test_malformed_supplied_hashes_are_recomputed(self):
+        manager = self._manager()
+        first = await manager.add_sources([
+            {"url": "https://example.com/a", "title": "First", "content": "aaa", "content_hash": "stale"}
+        ])
+        second = await manager.add_sources([
+            {"url": "https://example.com/b", "title": "Second", "content": "bbb",
+             "content_hash": hashlib.md5(b"bbb").hexdigest()}
+        ])
+        
+        self.assertEqual(first.content["added"], 1)
+        self.assertEqual(second.content["added"], 1)
+        stored = [row[0] for row in manager.db_connection.execute(
+            "SELECT content_hash FROM sources ORDER BY url"
+        )]
+        self.assertEqual(stored, [_content_hash("aaa"), _content_hash("bbb")])
+    
+    async def test_overwriting_supplied_id_replaces_title_signature(self):
+        manager = self._manager()
+        await manager.add_sources([
+            {"id": "s1", "url": "https://example.com/q", "title": "Quantum computing basics", "content": "Qubits"}
+        ])
+        await manager.get_source("s1")
+        result = await manager.add_sources([
+            {"id": "s1", "url": "https://example.com/p", "title": "Medieval pottery glazes", "content": "Kilns"}
+        ])
+        
+        self.assertEqual(result.content["added"], 1)
+        old_signature = manager._title_lsh.signature("Quantum computing basics")
+        new_signature = manager._title_lsh.signature("Medieval pottery glazes")
+        self.assertNotIn("s1", manager._title_lsh.query(old_signature))
+        self.assertIn("s1", manager._title_lsh.query(new_signature))
+        fetched = await manager.get_source("s1")
+        self.assertEqual(fetched.content["source"]["title"], "Medieval pottery glazes")
+    
+    async def test_fts_search_matches_like_search(self):
+        fts_manager = self._manager()
+        like_manager = self._manager()
+        self.assertTrue(fts_manager.fts_enabled)
+        like_manager.fts_enabled = False
+        for manager in (fts_manager, like_manager):
+            await manager.add_sources([dict(source) for source in SAMPLE_SOURCES])
+        
+        queries = [
+            {"content": "c++"},
+            {"title": "num"},
+            {"title": "NUM"},
+            {"content": "c"},
+            {"content": "a_b"},
+            {"content": "100%"},
+            {"title": "café"},
+            {"content": '"quantum"'},
+            {"title": "um", "content": "++"},
+            {"title": "numer", "content": "fortran"},
+            {"content": "python", "tags": ["python"]},
+            {"title": "no such title"},
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                fts = await fts_manager.search_sources(dict(query))
+                like = await like_manager.search_sources(dict(query))
+                self.assertEqual(fts.content["status"], "success")
+                self.assertEqual(
+                    [s["url"] for s in fts.content["sources"]],
+                    [s["url"] for s in like.content["sources"]]
+                )
+    
+    async def test_migrates_version_0_database(self):
+        data_dir = tempfile.mkdtemp(prefix="ara_test_")
+        self.addCleanup(shutil.rmtree, data_dir)
+        db_path = os.path.join(data_dir, "sources.db")
+        
+        # Schema and MD5 content hashes as written by the original SourceManager
+        connection = sqlite3.connect(db_path)
+        connection.executescript("""
+            CREATE TABLE sources (
+                id TEXT PRIMARY KEY, url TEXT NOT NULL, title TEXT, content TEXT,
+                domain TEXT, author TEXT, publish_date TEXT, last_accessed TEXT,
+                credibility_score REAL, tags TEXT, metadata TEXT, content_hash TEXT,
+                created_date TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE collections (
+                id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT, sources TEXT,
+                created_date TEXT, last_updated TEXT, metadata TEXT
+            );
+            CREATE TABLE source_relations (
+                source_id1 TEXT, source_id2 TEXT, relation_type TEXT, confidence REAL,
+                created_date TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (source_id1, source_id2, relation_type)
+            );
+            CREATE INDEX idx_sources_domain ON sources(domain);
+        """)
+        content = "Solar adoption in C++ simulations"
+        connection.execute(
+            "INSERT INTO sources (id, url, title, content, domain, last_accessed, credibility_score, "
+            "tags, metadata, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("legacy1", "https://example.com/solar", "Solar energy trends", content, "example.com",
+             "2024-01-01T00:00:00", 0.7, json.dumps(["energy", "Solar"]), json.dumps({"lang": "en"}),
+             hashlib.md5(content.encode()).hexdigest())
+        )
+        connection.commit()
+        connection.close()
+        
+        manager = SourceManager({"db_path": db_path, "wal_checkpoint_interval": 0})
+        self.managers.append(manager)
+        db = manager.db_connection
+        
+        self.assertEqual(db.execute("PRAGMA user_version").fetchone()[0], _SCHEMA_VERSION)
+        row = db.execute("SELECT content_hash, minhash FROM sources WHERE id = 'legacy1'").fetchone()
+        self.assertEqual(row["content_hash"], _content_hash(content))
+        self.assertIsNotNone(row["minhash"])
+        tags = [r["tag"] for r in db.execute("SELECT tag FROM source_tags ORDER BY tag")]
+        self.assertEqual(tags, ["energy", "Solar"])
+        
+        by_content = await manager.search_sources({"content": "c++"})
+        self.assertEqual([s["id"] for s in by_content.content["sources"]], ["legacy1"])
+        by_tag = await manager.search_sources({"tags": ["solar"]})
+        self.assertEqual([s["id"] for s in by_tag.content["sources"]], ["legacy1"])
+        
+        # Migrated rows take part in duplicate detection
+        result = await manager.add_sources([{
+            "url": "https://example.net/other", "title": "Solar energy trends", "content": "Different body"
+        }])
+        self.assertEqual(result.content["duplicates"], 1)
+    
+    async def test_source_cache_evicts_least_recently_used(self):
+        manager = self._manager(cache_size_limit=2)
+        added = await manager.add_sources([dict(source) for source in SAMPLE_SOURCES[:3]])
+        first, second, third = added.content["source_ids"]
+        
+        await manager.get_source(first)
+        await manager.get_source(second)
+        await manager.get_source(first)  # second is now least recently used
+        await manager.get_source(third)
+        self.assertEqual(list(manager.source_cache), [first, third])
+        
+        await manager.delete_source(third)
+        self.assertNotIn(third, manager.source_cache)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
@@ -10,6 +14,13 @@ class ResearchLogger:
     def __init__(self, log_level: str = "INFO", log_file: Optional[str] = None):
         self.logger = logging.getLogger("ResearchAssistant")
         self.logger.setLevel(log_level)
+        self.log_file = log_file
+        
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        
+        # Handlers are shared by every instance; only the first one opens a log file
+        if self.logger.handlers:
+            return
         
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
@@ -36,53 +47,63 @@ class ResearchLogger:
         )
         console_handler.setFormatter(console_formatter)
         
-        # Add handlers if not already added
-        if not self.logger.handlers:
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+        # Records are queued by callers and written by a background thread,
+        # so file and console I/O never runs on the event loop
+        log_queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
         
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         self.log_file = log_file
     
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        """Log an info message."""
-        self.logger.info(message, extra=extra)
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None):
+        """Log an info message; %-style args are formatted only if the record is emitted."""
+        self.logger.info(message, *args, extra=extra)
     
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None):
         """Log a debug message."""
-        self.logger.debug(message, extra=extra)
+        self.logger.debug(message, *args, extra=extra)
     
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None):
         """Log a warning message."""
-        self.logger.warning(message, extra=extra)
+        self.logger.warning(message, *args, extra=extra)
     
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None):
         """Log an error message."""
-        self.logger.error(message, extra=extra, exc_info=True)
+        self.logger.error(message, *args, extra=extra, exc_info=True)
     
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def critical(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None):
         """Log a critical message."""
-        self.logger.critical(message, extra=extra, exc_info=True)
+        self.logger.critical(message, *args, extra=extra, exc_info=True)
     
     def log_metric(self, name: str, value: Any, step: Optional[int] = None):
         """Log a metric value for tracking performance."""
-        self.logger.info(f"METRIC: {name} = {value} (step: {step if step is not None else 'N/A'}")
+        self.logger.info("METRIC: %s = %s (step: %s)", name, value, step if step is not None else 'N/A')
     
     def log_phase_start(self, phase_name: str, metadata: Optional[Dict[str, Any]] = None):
         """Log the start of a research phase."""
-        self.logger.info(f"PHASE_START: {phase_name}", extra={"metadata": metadata or {}})
+        self.logger.info("PHASE_START: %s", phase_name, extra={"metadata": metadata or {}})
     
     def log_phase_end(self, phase_name: str, status: str, metadata: Optional[Dict[str, Any]] = None):
         """Log the end of a research phase."""
-        self.logger.info(f"PHASE_END: {phase_name} - {status}", extra={"metadata": metadata or {}})
+        self.logger.info("PHASE_END: %s - %s", phase_name, status, extra={"metadata": metadata or {}})
     
     def log_agent_action(self, agent_name: str, action: str, metadata: Optional[Dict[str, Any]] = None):
         """Log an agent's action."""
-        self.logger.debug(f"AGENT_ACTION: {agent_name} - {action}", extra={"metadata": metadata or {}})
+        self.logger.debug("AGENT_ACTION: %s - %s", agent_name, action, extra={"metadata": metadata or {}})
     
     def log_source_processed(self, source_url: str, status: str, metadata: Optional[Dict[str, Any]] = None):
         """Log the processing status of a source."""
-        self.logger.info(f"SOURCE_PROCESSED: {source_url} - {status}", extra={"metadata": metadata or {}})
+        self.logger.info("SOURCE_PROCESSED: %s - %s", source_url, status, extra={"metadata": metadata or {}})
     
     def log_research_event(self, event_type: str, message: str, metadata: Optional[Dict[str, Any]] = None):
         """Log a custom research event."""
-        self.logger.info(f"EVENT:{event_type.upper()} - {message}", extra={"metadata": metadata or {}})
+        self.logger.info("EVENT:%s - %s", event_type.upper(), message, extra={"metadata": metadata or {}})
+
+@lru_cache(maxsize=1)
+def get_logger() -> ResearchLogger:
+    """Return the process-wide ResearchLogger, creating it on first use."""
+    return ResearchLogger()